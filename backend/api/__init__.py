@@ -2,6 +2,7 @@ from flask import Flask
 from flask_cors import CORS
 from api.config import Config
 from api.extensions import db
+from api.json_provider import OrjsonProvider
 from sqlalchemy import text
 import os
 
@@ -16,9 +17,15 @@ def init_database(app):
     
     with app.app_context():
         try:
-            # Check if tables already exist
+            schema = app.config.get('DATABASE_SCHEMA')
+            if schema:
+                db.session.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"'))
+                db.session.commit()
+            
+            # Check if tables already exist (to_regclass follows search_path, so a
+            # Users table in another schema doesn't count)
             result = db.session.execute(text(
-                "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'users')"
+                "SELECT to_regclass('users') IS NOT NULL"
             ))
             tables_exist = result.scalar()
             
@@ -42,6 +49,7 @@ def init_database(app):
 
 def create_app():
     app = Flask(__name__, static_folder='../static')
+    app.json = OrjsonProvider(app)
     app.config.from_object(Config)
     
     # Configure CORS with explicit settings for local development
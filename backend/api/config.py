@@ -10,12 +10,30 @@ class Config:
     DATABASE_NAME = os.getenv('DATABASE_NAME', 'social_media_db')
     DATABASE_USER = os.getenv('DATABASE_USER', 'postgres')
     DATABASE_PASSWORD = os.getenv('DATABASE_PASSWORD', '')
+    # Optional schema to work in instead of public (parallel test workers each get their own)
+    DATABASE_SCHEMA = os.getenv('DATABASE_SCHEMA', '')
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key')
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key')
     
     # SQLAlchemy configuration
     SQLALCHEMY_DATABASE_URI = f"postgresql://{DATABASE_USER}:{DATABASE_PASSWORD}@{DATABASE_HOST}:{DATABASE_PORT}/{DATABASE_NAME}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        # Each request thread checks out one connection on its first query and holds it until
+        # the session is removed at request teardown, so size for concurrent requests
+        "pool_size": int(os.getenv('DATABASE_POOL_SIZE', '10')),
+        "max_overflow": int(os.getenv('DATABASE_MAX_OVERFLOW', '20')),
+        # Give up after 10s when the pool is exhausted (SQLAlchemy's default wait is 30s)
+        "pool_timeout": int(os.getenv('DATABASE_POOL_TIMEOUT', '10')),
+        # Replace connections dropped by Postgres/pgbouncer before handing them out
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.getenv('DATABASE_POOL_RECYCLE', '1800')),
+    }
+    if DATABASE_SCHEMA:
+        SQLALCHEMY_ENGINE_OPTIONS["connect_args"] = {"options": f"-c search_path={DATABASE_SCHEMA}"}
+    
+    # Optional Redis cache (disabled when unset)
+    REDIS_URL = os.getenv('REDIS_URL', '')
     
     # CORS Configuration
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:3000,http://localhost:5173,http://127.0.0.1:3000,http://127.0.0.1:5173').split(',')
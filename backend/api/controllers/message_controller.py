@@ -56,8 +56,9 @@ def get_conversation(other_user_id):
         user_id = g.current_user_id
         limit = request.args.get('limit', 50, type=int)
         offset = request.args.get('offset', 0, type=int)
+        before_id = request.args.get('before_id', None, type=int)
         
-        result = message_service.get_conversation(user_id, other_user_id, limit, offset)
+        result = message_service.get_conversation(user_id, other_user_id, limit, offset, before_id)
         
         if not result["success"]:
             return make_response(jsonify({"error": result["error"]}), 400)
@@ -86,6 +87,21 @@ def mark_message_as_read(message_id):
         return make_response(jsonify({"error": str(e)}), 500)
 
 
+@message_bp.route('/messages/conversations/<int:other_user_id>/read', methods=['PUT'])
+@token_required
+def mark_conversation_as_read(other_user_id):
+    """Mark all messages from a specific user as read"""
+    try:
+        user_id = g.current_user_id
+        
+        result = message_service.mark_conversation_read(user_id, other_user_id)
+        
+        return make_response(jsonify(result), 200)
+    
+    except Exception as e:
+        return make_response(jsonify({"error": str(e)}), 500)
+
+
 @message_bp.route('/messages/<int:message_id>', methods=['DELETE'])
 @token_required
 def delete_message(message_id):
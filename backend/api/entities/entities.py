@@ -63,6 +63,8 @@ class User:
     bio: Optional[str] = None
     profile_picture_url: Optional[str] = None
     is_private: bool = False
+    followers_count: int = 0
+    following_count: int = 0
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -78,6 +80,8 @@ class User:
             bio=row.bio,
             profile_picture_url=row.profile_picture_url,
             is_private=row.is_private,
+            followers_count=getattr(row, 'followers_count', 0),
+            following_count=getattr(row, 'following_count', 0),
             created_at=row.created_at,
             updated_at=getattr(row, 'updated_at', None)
         )
@@ -118,6 +122,8 @@ class Post:
     community_id: Optional[int] = None
     content: Optional[str] = None
     media_url: Optional[str] = None
+    like_count: int = 0
+    comment_count: int = 0
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -131,6 +137,8 @@ class Post:
             community_id=row.community_id,
             content=row.content,
             media_url=row.media_url,
+            like_count=getattr(row, 'like_count', 0),
+            comment_count=getattr(row, 'comment_count', 0),
             created_at=row.created_at,
             updated_at=getattr(row, 'updated_at', None)
         )
@@ -225,7 +233,8 @@ class Comment:
 
     def validate(self) -> List[str]:
         errors = []
-        if not self.content or len(self.content.strip()) == 0:
+        # isspace() scans in place instead of copying the content like strip()
+        if not self.content or self.content.isspace():
             errors.append("Comment content is required")
         if self.content and len(self.content) > 2000:
             errors.append("Comment must be at most 2000 characters")
@@ -376,10 +385,15 @@ class Message:
         }
 
     def validate(self) -> List[str]:
+        return self.validate_fields(self.content, self.media_url)
+
+    @staticmethod
+    def validate_fields(content: Optional[str], media_url: Optional[str]) -> List[str]:
+        """Validate message payload fields without building a Message"""
         errors = []
-        if not self.content and not self.media_url:
+        if not content and not media_url:
             errors.append("Message must have content or media")
-        if self.content and len(self.content) > 5000:
+        if content and len(content) > 5000:
             errors.append("Message must be at most 5000 characters")
         return errors
 
@@ -48,7 +48,7 @@ class CommentRepository:
             FROM Comments c
             JOIN Users u ON c.user_id = u.user_id
             WHERE c.post_id = :post_id AND c.parent_comment_id IS NULL
-            ORDER BY c.created_at ASC 
+            ORDER BY c.created_at ASC, c.comment_id ASC 
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -65,7 +65,7 @@ class CommentRepository:
             FROM Comments c
             JOIN Users u ON c.user_id = u.user_id
             WHERE c.user_id = :user_id 
-            ORDER BY c.created_at DESC 
+            ORDER BY c.created_at DESC, c.comment_id DESC 
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -115,7 +115,7 @@ class CommentRepository:
             FROM Comments c
             JOIN Users u ON c.user_id = u.user_id
             WHERE c.parent_comment_id = :comment_id 
-            ORDER BY c.created_at ASC 
+            ORDER BY c.created_at ASC, c.comment_id ASC 
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -131,6 +131,43 @@ class CommentRepository:
         result = self.db.session.execute(query, {"comment_id": comment_id})
         return result.scalar()
 
+    def get_by_post_id_with_reply_counts(self, post_id: int, limit: int = 100, offset: int = 0) -> List[dict]:
+        """Get top-level comments for a post as API-ready dicts, reply counts included"""
+        return self._rows_with_reply_counts(
+            "c.post_id = :post_id AND c.parent_comment_id IS NULL",
+            {"post_id": post_id, "limit": limit, "offset": offset}
+        )
+
+    def get_replies_with_reply_counts(self, comment_id: int, limit: int = 100, offset: int = 0) -> List[dict]:
+        """Get replies to a comment as API-ready dicts, nested reply counts included"""
+        return self._rows_with_reply_counts(
+            "c.parent_comment_id = :comment_id",
+            {"comment_id": comment_id, "limit": limit, "offset": offset}
+        )
+
+    def _rows_with_reply_counts(self, where_clause: str, params: dict) -> List[dict]:
+        query = text(f"""
+            SELECT 
+                c.comment_id as id, c.comment_id, c.post_id, c.user_id, c.content, c.parent_comment_id,
+                u.username, u.profile_picture_url as user_profile_picture,
+                c.created_at, c.updated_at,
+                (SELECT COUNT(*) FROM Comments r WHERE r.parent_comment_id = c.comment_id) as reply_count
+            FROM Comments c
+            JOIN Users u ON c.user_id = u.user_id
+            WHERE {where_clause}
+            ORDER BY c.created_at ASC, c.comment_id ASC 
+            LIMIT :limit OFFSET :offset
+        """)
+        result = self.db.session.execute(query, params)
+        rows = [dict(row._mapping) for row in result.fetchall()]
+        # Convert datetime to isoformat for JSON serialization
+        for row in rows:
+            if row.get('created_at'):
+                row['created_at'] = row['created_at'].isoformat()
+            if row.get('updated_at'):
+                row['updated_at'] = row['updated_at'].isoformat()
+        return rows
+
     def get_by_user_id_with_posts(self, user_id: int, limit: int = 50, offset: int = 0) -> List[dict]:
         """Get all comments by a user with their associated post data"""
         query = text("""
@@ -145,7 +182,7 @@ class CommentRepository:
             JOIN Users post_author ON p.user_id = post_author.user_id
             JOIN Users commenter ON c.user_id = commenter.user_id
             WHERE c.user_id = :user_id
-            ORDER BY c.created_at DESC
+            ORDER BY c.created_at DESC, c.comment_id DESC
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
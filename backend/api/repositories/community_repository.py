@@ -70,7 +70,7 @@ class CommunityRepository:
                     cm.role_id
                 FROM Communities c
                 LEFT JOIN CommunityMembers cm ON c.community_id = cm.community_id AND cm.user_id = :user_id
-                ORDER BY c.created_at DESC 
+                ORDER BY c.created_at DESC, c.community_id DESC 
                 LIMIT :limit OFFSET :offset
             """)
             result = self.db.session.execute(query, {"limit": limit, "offset": offset, "user_id": user_id})
@@ -78,7 +78,7 @@ class CommunityRepository:
             query = text("""
                 SELECT *, FALSE as is_member, NULL as role_id
                 FROM Communities
-                ORDER BY created_at DESC 
+                ORDER BY created_at DESC, community_id DESC 
                 LIMIT :limit OFFSET :offset
             """)
             result = self.db.session.execute(query, {"limit": limit, "offset": offset})
@@ -95,7 +95,7 @@ class CommunityRepository:
                 FROM Communities c
                 LEFT JOIN CommunityMembers cm ON c.community_id = cm.community_id AND cm.user_id = :user_id
                 WHERE c.name ILIKE :search_term OR c.description ILIKE :search_term
-                ORDER BY c.created_at DESC 
+                ORDER BY c.created_at DESC, c.community_id DESC 
                 LIMIT :limit OFFSET :offset
             """)
             result = self.db.session.execute(query, {
@@ -109,7 +109,7 @@ class CommunityRepository:
                 SELECT *, FALSE as is_member, NULL as role_id
                 FROM Communities
                 WHERE name ILIKE :search_term OR description ILIKE :search_term
-                ORDER BY created_at DESC 
+                ORDER BY created_at DESC, community_id DESC 
                 LIMIT :limit OFFSET :offset
             """)
             result = self.db.session.execute(query, {
@@ -154,12 +154,14 @@ class CommunityRepository:
         self.db.session.commit()
         return result.fetchone() is not None
     
-    def add_member(self, community_id: int, user_id: int, role_id: int) -> CommunityMember:
-        """Add a member to a community with a specific role"""
+    def add_member(self, community_id: int, user_id: int, role_id: int) -> Optional[CommunityMember]:
+        """Add a member to a community with a specific role.
+        Returns None if the user is already a member (the primary key decides, no precheck needed)."""
         try:
             query = text("""
                 INSERT INTO CommunityMembers (community_id, user_id, role_id)
                 VALUES (:community_id, :user_id, :role_id)
+                ON CONFLICT (community_id, user_id) DO NOTHING
                 RETURNING community_id, user_id, role_id, joined_at
             """)
             
@@ -168,11 +170,12 @@ class CommunityRepository:
                 "user_id": user_id,
                 "role_id": role_id
             })
+            row = result.fetchone()
             self.db.session.commit()
-            return CommunityMember.from_row(result.fetchone())
+            return CommunityMember.from_row(row)
         except IntegrityError:
             self.db.session.rollback()
-            raise ValueError("User is already a member of this community")
+            raise ValueError("Community or user not found")
         except SQLAlchemyError:
             self.db.session.rollback()
             raise
@@ -191,6 +194,56 @@ class CommunityRepository:
         self.db.session.commit()
         return result.fetchone() is not None
     
+    def remove_member_unless_last_admin(self, community_id: int, user_id: int) -> Optional[int]:
+        """Remove a member unless they are the only admin of the community.
+        Returns the removed member's role_id, or None if nothing was deleted."""
+        query = text("""
+            DELETE FROM CommunityMembers cm
+            WHERE cm.community_id = :community_id AND cm.user_id = :user_id
+              AND (
+                  cm.role_id <> 1
+                  OR EXISTS (
+                      SELECT 1 FROM CommunityMembers other
+                      WHERE other.community_id = cm.community_id
+                        AND other.role_id = 1
+                        AND other.user_id <> cm.user_id
+                  )
+              )
+            RETURNING cm.role_id
+        """)
+        result = self.db.session.execute(query, {
+            "community_id": community_id,
+            "user_id": user_id
+        })
+        row = result.fetchone()
+        self.db.session.commit()
+        return row.role_id if row else None
+    
+    def remove_member_as(self, community_id: int, requester_id: int, target_user_id: int) -> Optional[int]:
+        """Remove a member if the requester may do so: requester is an admin or moderator,
+        the target is not the creator-admin, and moderators cannot remove admins.
+        Returns the removed member's role_id, or None if nothing was deleted."""
+        query = text("""
+            DELETE FROM CommunityMembers cm
+            USING Communities c, CommunityMembers requester
+            WHERE cm.community_id = :community_id AND cm.user_id = :target_user_id
+              AND c.community_id = cm.community_id
+              AND requester.community_id = cm.community_id
+              AND requester.user_id = :requester_id
+              AND requester.role_id IN (1, 2)
+              AND NOT (cm.user_id = c.creator_id AND cm.role_id = 1)
+              AND NOT (requester.role_id = 2 AND cm.role_id = 1)
+            RETURNING cm.role_id
+        """)
+        result = self.db.session.execute(query, {
+            "community_id": community_id,
+            "requester_id": requester_id,
+            "target_user_id": target_user_id
+        })
+        row = result.fetchone()
+        self.db.session.commit()
+        return row.role_id if row else None
+    
     def update_member_role(self, community_id: int, user_id: int, role_id: int) -> Optional[CommunityMember]:
         """Update a member's role in a community"""
         try:
@@ -213,17 +266,15 @@ class CommunityRepository:
             raise
     
     def get_members(self, community_id: int, limit: int = 50, offset: int = 0) -> List[dict]:
-        """Get all members of a community with user and role details"""
+        """Get all members of a community with the profile fields needed for display"""
         query = text("""
-            SELECT 
-                cm.community_id, cm.user_id, cm.role_id, cm.joined_at,
-                u.username, u.email, u.bio, u.profile_picture_url,
-                r.role_name
+            SELECT
+                cm.user_id, cm.role_id, cm.joined_at,
+                u.username, u.profile_picture_url
             FROM CommunityMembers cm
-            JOIN Users u ON cm.user_id = u.user_id
-            JOIN Roles r ON cm.role_id = r.role_id
+            JOIN Users u ON u.user_id = cm.user_id
             WHERE cm.community_id = :community_id
-            ORDER BY cm.joined_at DESC
+            ORDER BY cm.role_id, u.username
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -258,17 +309,18 @@ class CommunityRepository:
             JOIN Communities c ON cm.community_id = c.community_id
             JOIN Roles r ON cm.role_id = r.role_id
             WHERE cm.user_id = :user_id
-            ORDER BY cm.joined_at DESC
+            ORDER BY cm.joined_at DESC, c.community_id DESC
         """)
         result = self.db.session.execute(query, {"user_id": user_id})
         return [dict(row._mapping) for row in result.fetchall()]
     
-    def count_members(self, community_id: int) -> int:
-        """Count the number of members in a community"""
+    def count_members(self, community_id: int, role_id: Optional[int] = None) -> int:
+        """Count the number of members in a community, optionally only those with a given role"""
         query = text("""
             SELECT COUNT(*) as count FROM CommunityMembers 
             WHERE community_id = :community_id
+              AND (:role_id IS NULL OR role_id = :role_id)
         """)
-        result = self.db.session.execute(query, {"community_id": community_id})
+        result = self.db.session.execute(query, {"community_id": community_id, "role_id": role_id})
         row = result.fetchone()
         return row.count if row else 0
@@ -10,8 +10,8 @@ class FeaturesRepository:
         self.db = db
 
     def get_popular_posts(self, limit: int = 20) -> List[Dict]:
-        """Get popular posts from the materialized view"""
-        query = text("SELECT * FROM popular_posts_view LIMIT :limit")
+        """Get popular posts from the materialized view (public authors only; this list is unauthenticated)"""
+        query = text("SELECT * FROM popular_posts_view WHERE NOT author_is_private LIMIT :limit")
         result = self.db.session.execute(query, {"limit": limit})
         
         posts = []
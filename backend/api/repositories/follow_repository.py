@@ -2,6 +2,7 @@ from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from api.extensions import db
 from api.entities.entities import Follow
+from api.services import cache
 from typing import Optional, List
 
 
@@ -24,6 +25,9 @@ class FollowRepository:
                 "status_id": follow.status_id
             })
             self.db.session.commit()
+            # Follow counters on both Users rows were changed by trigger
+            cache.invalidate_user(follow.follower_id, follow.following_id)
+            cache.invalidate_following(follow.follower_id)
             return Follow.from_row(result.fetchone())
         except IntegrityError:
             self.db.session.rollback()
@@ -32,6 +36,39 @@ class FollowRepository:
             self.db.session.rollback()
             raise
 
+    def upsert_follow_request(self, follower_id: int, following_id: int) -> Optional[Follow]:
+        """Create a follow (accepted for public users, pending for private ones) or re-request
+        a rejected one, in a single statement.
+        
+        Returns None when nothing changed (the user does not exist, or a pending/accepted
+        follow already exists).
+        """
+        try:
+            query = text("""
+                INSERT INTO Follows (follower_id, following_id, status_id)
+                SELECT :follower_id, u.user_id, CASE WHEN u.is_private THEN 1 ELSE 2 END
+                FROM Users u
+                WHERE u.user_id = :following_id
+                ON CONFLICT (follower_id, following_id) DO UPDATE
+                    SET status_id = 1
+                    WHERE Follows.status_id = 3
+                RETURNING follower_id, following_id, status_id, created_at
+            """)
+            
+            result = self.db.session.execute(query, {
+                "follower_id": follower_id,
+                "following_id": following_id
+            })
+            follow = Follow.from_row(result.fetchone())
+            self.db.session.commit()
+            if follow:
+                cache.invalidate_user(follower_id, following_id)
+                cache.invalidate_following(follower_id)
+            return follow
+        except SQLAlchemyError:
+            self.db.session.rollback()
+            raise
+
     def get_by_ids(self, follower_id: int, following_id: int) -> Optional[Follow]:
         """Get follow relationship by follower and following IDs"""
         query = text("""
@@ -60,6 +97,8 @@ class FollowRepository:
                 "status_id": status_id
             })
             self.db.session.commit()
+            cache.invalidate_user(follower_id, following_id)
+            cache.invalidate_following(follower_id)
             return Follow.from_row(result.fetchone())
         except SQLAlchemyError:
             self.db.session.rollback()
@@ -77,6 +116,8 @@ class FollowRepository:
             "following_id": following_id
         })
         self.db.session.commit()
+        cache.invalidate_user(follower_id, following_id)
+        cache.invalidate_following(follower_id)
         return result.fetchone() is not None
 
     def get_followers(self, user_id: int, current_user_id: Optional[int] = None, limit: int = 100, offset: int = 0) -> List[dict]:
@@ -97,7 +138,7 @@ class FollowRepository:
             FROM Follows f
             JOIN Users u ON f.follower_id = u.user_id
             WHERE f.following_id = :user_id AND f.status_id = 2
-            ORDER BY f.created_at DESC
+            ORDER BY f.created_at DESC, f.follower_id DESC
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -126,7 +167,7 @@ class FollowRepository:
             FROM Follows f
             JOIN Users u ON f.following_id = u.user_id
             WHERE f.follower_id = :user_id AND f.status_id = 2
-            ORDER BY f.created_at DESC
+            ORDER BY f.created_at DESC, f.following_id DESC
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -144,7 +185,7 @@ class FollowRepository:
             FROM Follows f
             JOIN Users u ON f.follower_id = u.user_id
             WHERE f.following_id = :user_id AND f.status_id = 1
-            ORDER BY f.created_at DESC
+            ORDER BY f.created_at DESC, f.follower_id DESC
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -181,18 +222,36 @@ class FollowRepository:
         row = result.fetchone()
         return row.count if row else 0
 
+    def get_following_ids(self, user_id: int) -> List[int]:
+        """Get the IDs of all users a user follows (accepted status)"""
+        query = text("""
+            SELECT following_id FROM Follows
+            WHERE follower_id = :user_id AND status_id = 2
+        """)
+        result = self.db.session.execute(query, {"user_id": user_id})
+        return [row.following_id for row in result.fetchall()]
+
+    def is_following_cached(self, follower_id: int, following_id: int) -> bool:
+        """Check an accepted follow against the follower's cached following set,
+        loading the whole set on a miss so later checks for other authors are free"""
+        cached = cache.is_following(follower_id, following_id)
+        if cached is not None:
+            return cached
+        following_ids = self.get_following_ids(follower_id)
+        cache.set_following(follower_id, following_ids)
+        return following_id in following_ids
+
     def is_following(self, follower_id: int, following_id: int) -> bool:
         """Check if follower is following another user (accepted status)"""
         query = text("""
-            SELECT COUNT(*) as count 
-            FROM Follows 
-            WHERE follower_id = :follower_id 
-            AND following_id = :following_id 
-            AND status_id = 2
+            SELECT EXISTS(
+                SELECT 1 FROM Follows 
+                WHERE follower_id = :follower_id 
+                AND following_id = :following_id 
+                AND status_id = 2
+            )
         """)
-        result = self.db.session.execute(query, {
+        return self.db.session.execute(query, {
             "follower_id": follower_id,
             "following_id": following_id
-        })
-        row = result.fetchone()
-        return row.count > 0 if row else False
+        }).scalar()
@@ -2,9 +2,27 @@ from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from api.extensions import db
 from api.entities.entities import Message
+from api.services import cache
 from typing import Optional, List
 
 
+# One page of a two-user conversation, newest first; shared by the plain and the
+# profile-joined conversation queries
+_CONVERSATION_PAGE_SQL = """
+    SELECT * FROM Messages 
+    WHERE ((sender_id = :user1_id AND receiver_id = :user2_id)
+       OR (sender_id = :user2_id AND receiver_id = :user1_id))
+      AND (
+          :before_id IS NULL
+          OR (created_at, message_id) < (
+              SELECT created_at, message_id FROM Messages WHERE message_id = :before_id
+          )
+      )
+    ORDER BY created_at DESC, message_id DESC
+    LIMIT :limit OFFSET :offset
+"""
+
+
 class MessageRepository:
     def __init__(self):
         self.db = db
@@ -26,6 +44,8 @@ class MessageRepository:
                 "is_read": message.is_read
             })
             self.db.session.commit()
+            if not message.is_read:
+                cache.incr_unread_count(message.receiver_id)
             return Message.from_row(result.fetchone())
         except SQLAlchemyError:
             self.db.session.rollback()
@@ -37,51 +57,94 @@ class MessageRepository:
         result = self.db.session.execute(query, {"message_id": message_id})
         return Message.from_row(result.fetchone())
 
-    def get_conversation(self, user1_id: int, user2_id: int, limit: int = 50, offset: int = 0) -> List[Message]:
-        """Get conversation between two users"""
-        query = text("""
-            SELECT * FROM Messages 
-            WHERE (sender_id = :user1_id AND receiver_id = :user2_id)
-               OR (sender_id = :user2_id AND receiver_id = :user1_id)
-            ORDER BY created_at DESC
-            LIMIT :limit OFFSET :offset
-        """)
+    def get_conversation(self, user1_id: int, user2_id: int, limit: int = 50, offset: int = 0,
+                         before_id: Optional[int] = None) -> List[Message]:
+        """Get conversation between two users, newest first
+        
+        Pass before_id (the last message_id of the previous page) for keyset pagination;
+        offset is kept for older clients but gets slower the deeper it pages.
+        """
+        query = text(_CONVERSATION_PAGE_SQL)
         result = self.db.session.execute(query, {
             "user1_id": user1_id,
             "user2_id": user2_id,
+            "before_id": before_id,
             "limit": limit,
-            "offset": offset
+            "offset": 0 if before_id else offset
         })
         return [Message.from_row(row) for row in result.fetchall()]
 
+    def get_conversation_with_user(self, user1_id: int, user2_id: int, limit: int = 50, offset: int = 0,
+                                   before_id: Optional[int] = None) -> Optional[dict]:
+        """Get the other user's profile and a page of the conversation in one query
+        
+        Returns None when user2 doesn't exist, otherwise
+        {"other_user": {...}, "messages": [Message, ...]}.
+        """
+        query = text(f"""
+            WITH page AS ({_CONVERSATION_PAGE_SQL})
+            SELECT
+                u.user_id AS other_user_id,
+                u.username AS other_username,
+                u.profile_picture_url AS other_profile_picture_url,
+                page.*
+            FROM Users u
+            LEFT JOIN page ON TRUE
+            WHERE u.user_id = :user2_id
+            ORDER BY page.created_at DESC, page.message_id DESC
+        """)
+        result = self.db.session.execute(query, {
+            "user1_id": user1_id,
+            "user2_id": user2_id,
+            "before_id": before_id,
+            "limit": limit,
+            "offset": 0 if before_id else offset
+        })
+        rows = result.fetchall()
+        if not rows:
+            return None
+        
+        return {
+            "other_user": {
+                "user_id": rows[0].other_user_id,
+                "username": rows[0].other_username,
+                "profile_picture_url": rows[0].other_profile_picture_url
+            },
+            # An empty conversation still yields the user row, with NULL message columns
+            "messages": [Message.from_row(row) for row in rows if row.message_id is not None]
+        }
+
     def get_user_conversations(self, user_id: int, limit: int = 50, offset: int = 0) -> List[dict]:
-        """Get all conversations for a user with last message"""
+        """Get all conversations for a user with partner profile, last message and unread count"""
         query = text("""
-            WITH ranked_messages AS (
-                SELECT 
-                    m.*,
-                    CASE 
-                        WHEN m.sender_id = :user_id THEN m.receiver_id 
-                        ELSE m.sender_id 
-                    END as other_user_id,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY CASE 
-                            WHEN m.sender_id = :user_id THEN m.receiver_id 
-                            ELSE m.sender_id 
-                        END 
-                        ORDER BY m.created_at DESC
-                    ) as rn
-                FROM Messages m
-                WHERE m.sender_id = :user_id OR m.receiver_id = :user_id
+            WITH latest AS (
+                SELECT DISTINCT ON (m.other_user_id) m.*
+                FROM (
+                    SELECT 
+                        msg.*,
+                        CASE 
+                            WHEN msg.sender_id = :user_id THEN msg.receiver_id 
+                            ELSE msg.sender_id 
+                        END as other_user_id
+                    FROM Messages msg
+                    WHERE msg.sender_id = :user_id OR msg.receiver_id = :user_id
+                ) m
+                ORDER BY m.other_user_id, m.created_at DESC, m.message_id DESC
+            ), unread AS (
+                SELECT sender_id as other_user_id, COUNT(*) as unread_count
+                FROM Messages
+                WHERE receiver_id = :user_id AND is_read = FALSE
+                GROUP BY sender_id
             )
             SELECT 
-                rm.*,
+                l.*,
                 u.username,
-                u.profile_picture_url
-            FROM ranked_messages rm
-            JOIN Users u ON rm.other_user_id = u.user_id
-            WHERE rm.rn = 1
-            ORDER BY rm.created_at DESC
+                u.profile_picture_url,
+                COALESCE(un.unread_count, 0) as unread_count
+            FROM latest l
+            JOIN Users u ON l.other_user_id = u.user_id
+            LEFT JOIN unread un ON un.other_user_id = l.other_user_id
+            ORDER BY l.created_at DESC
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -103,19 +166,22 @@ class MessageRepository:
             
             result = self.db.session.execute(query, {"message_id": message_id})
             self.db.session.commit()
-            return Message.from_row(result.fetchone())
+            message = Message.from_row(result.fetchone())
+            if message:
+                cache.invalidate_unread_count(message.receiver_id)
+            return message
         except SQLAlchemyError:
             self.db.session.rollback()
             raise
 
     def mark_conversation_as_read(self, receiver_id: int, sender_id: int) -> int:
-        """Mark all messages in a conversation as read"""
+        """Mark all unread messages from sender to receiver as read in one statement.
+        Returns the number of messages updated."""
         try:
             query = text("""
                 UPDATE Messages 
                 SET is_read = TRUE
                 WHERE receiver_id = :receiver_id AND sender_id = :sender_id AND is_read = FALSE
-                RETURNING message_id
             """)
             
             result = self.db.session.execute(query, {
@@ -123,7 +189,10 @@ class MessageRepository:
                 "sender_id": sender_id
             })
             self.db.session.commit()
-            return len(result.fetchall())
+            updated = result.rowcount
+            if updated:
+                cache.incr_unread_count(receiver_id, -updated)
+            return updated
         except SQLAlchemyError:
             self.db.session.rollback()
             raise
@@ -133,14 +202,21 @@ class MessageRepository:
         query = text("""
             DELETE FROM Messages 
             WHERE message_id = :message_id
-            RETURNING message_id
+            RETURNING message_id, receiver_id
         """)
         result = self.db.session.execute(query, {"message_id": message_id})
         self.db.session.commit()
-        return result.fetchone() is not None
+        row = result.fetchone()
+        if row:
+            cache.invalidate_unread_count(row.receiver_id)
+        return row is not None
 
     def get_unread_count(self, user_id: int) -> int:
-        """Get count of unread messages for a user"""
+        """Get count of unread messages for a user (polled by clients, cached for a short TTL)"""
+        cached = cache.get_unread_count(user_id)
+        if cached is not None:
+            return cached
+        
         query = text("""
             SELECT COUNT(*) as count 
             FROM Messages 
@@ -148,4 +224,6 @@ class MessageRepository:
         """)
         result = self.db.session.execute(query, {"user_id": user_id})
         row = result.fetchone()
-        return row.count if row else 0
+        count = row.count if row else 0
+        cache.set_unread_count(user_id, count)
+        return count
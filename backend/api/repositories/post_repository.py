@@ -1,7 +1,7 @@
 from sqlalchemy import text
 from api.extensions import db
 from api.entities.entities import Post, PostLike
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
 
 class PostRepository:
@@ -13,7 +13,8 @@ class PostRepository:
         query = text("""
             INSERT INTO Posts (user_id, community_id, content, media_url)
             VALUES (:user_id, :community_id, :content, :media_url)
-            RETURNING post_id, user_id, community_id, content, media_url, created_at, updated_at
+            RETURNING post_id, user_id, community_id, content, media_url, like_count, comment_count,
+                created_at, updated_at
         """)
         
         result = self.db.session.execute(query, {
@@ -39,7 +40,7 @@ class PostRepository:
         query = text("""
             SELECT * FROM Posts 
             WHERE user_id = :user_id 
-            ORDER BY created_at DESC 
+            ORDER BY created_at DESC, post_id DESC 
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -54,7 +55,7 @@ class PostRepository:
         query = text("""
             SELECT * FROM Posts 
             WHERE community_id = :community_id 
-            ORDER BY created_at DESC 
+            ORDER BY created_at DESC, post_id DESC 
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -93,15 +94,23 @@ class PostRepository:
         self.db.session.commit()
         return result.fetchone() is not None
 
+    def delete_owned(self, post_id: int, user_id: int) -> bool:
+        """Delete a post only if it belongs to the given user"""
+        query = text("DELETE FROM Posts WHERE post_id = :post_id AND user_id = :user_id RETURNING post_id")
+        result = self.db.session.execute(query, {"post_id": post_id, "user_id": user_id})
+        self.db.session.commit()
+        return result.fetchone() is not None
+
     def get_feed(self, user_id: int, limit: int = 50, offset: int = 0) -> List[Post]:
         """Get posts from users that the given user follows (accepted follows only)"""
+        # (follower_id, following_id) is the Follows primary key, so the join can't duplicate posts
         query = text("""
-            SELECT DISTINCT p.* 
+            SELECT p.* 
             FROM Posts p
             INNER JOIN Follows f ON p.user_id = f.following_id
             WHERE f.follower_id = :user_id 
                 AND f.status_id = (SELECT status_id FROM FollowStatus WHERE status_name = 'accepted')
-            ORDER BY p.created_at DESC 
+            ORDER BY p.created_at DESC, p.post_id DESC 
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {
@@ -150,22 +159,71 @@ class PostRepository:
         self.db.session.commit()
         return result.fetchone() is not None
 
+    def like_post_with_stats(self, post_id: int, user_id: int) -> Dict:
+        """Like a post and return the outcome with fresh counts in one round-trip
+        
+        Returns post_exists, changed (False if already liked), like_count and comment_count.
+        """
+        query = text("""
+            WITH post AS (
+                SELECT post_id, like_count, comment_count FROM Posts WHERE post_id = :post_id
+            ), added AS (
+                INSERT INTO PostLikes (post_id, user_id)
+                SELECT post_id, :user_id FROM post
+                ON CONFLICT (post_id, user_id) DO NOTHING
+                RETURNING post_id
+            )
+            SELECT
+                EXISTS(SELECT 1 FROM post) AS post_exists,
+                EXISTS(SELECT 1 FROM added) AS changed,
+                (SELECT like_count FROM post) + (SELECT COUNT(*) FROM added) AS like_count,
+                (SELECT comment_count FROM post) AS comment_count
+        """)
+        result = self.db.session.execute(query, {"post_id": post_id, "user_id": user_id})
+        row = result.fetchone()
+        self.db.session.commit()
+        return dict(row._mapping)
+
+    def unlike_post_with_stats(self, post_id: int, user_id: int) -> Dict:
+        """Unlike a post and return the outcome with fresh counts in one round-trip
+        
+        Returns post_exists, changed (False if not liked), like_count and comment_count.
+        """
+        query = text("""
+            WITH post AS (
+                SELECT post_id, like_count, comment_count FROM Posts WHERE post_id = :post_id
+            ), removed AS (
+                DELETE FROM PostLikes
+                WHERE post_id = :post_id AND user_id = :user_id
+                RETURNING post_id
+            )
+            SELECT
+                EXISTS(SELECT 1 FROM post) AS post_exists,
+                EXISTS(SELECT 1 FROM removed) AS changed,
+                (SELECT like_count FROM post) - (SELECT COUNT(*) FROM removed) AS like_count,
+                (SELECT comment_count FROM post) AS comment_count
+        """)
+        result = self.db.session.execute(query, {"post_id": post_id, "user_id": user_id})
+        row = result.fetchone()
+        self.db.session.commit()
+        return dict(row._mapping)
+
     def get_post_likes(self, post_id: int) -> List[PostLike]:
         """Get all users who liked a post"""
         query = text("""
             SELECT post_id, user_id, created_at 
             FROM PostLikes 
             WHERE post_id = :post_id
-            ORDER BY created_at DESC
+            ORDER BY created_at DESC, user_id DESC
         """)
         result = self.db.session.execute(query, {"post_id": post_id})
         return [PostLike.from_row(row) for row in result.fetchall()]
 
     def count_likes(self, post_id: int) -> int:
-        """Count the number of likes on a post"""
-        query = text("SELECT COUNT(*) FROM PostLikes WHERE post_id = :post_id")
+        """Count the number of likes on a post (trigger-maintained counter, 0 if the post is missing)"""
+        query = text("SELECT like_count FROM Posts WHERE post_id = :post_id")
         result = self.db.session.execute(query, {"post_id": post_id})
-        return result.scalar()
+        return result.scalar() or 0
 
     def has_user_liked(self, post_id: int, user_id: int) -> bool:
         """Check if a user has liked a post"""
@@ -177,12 +235,14 @@ class PostRepository:
         return result.fetchone() is not None
 
     def get_with_stats(self, post_id: int, user_id: Optional[int] = None) -> Optional[Dict]:
-        """Get post with engagement metrics (like count, comment count, and user's like status)"""
+        """Get post with engagement metrics (like count, comment count, and user's like status)
+        
+        When user_id is given, posts by private authors are only returned to the author
+        and their accepted followers; otherwise None, as if the post did not exist.
+        """
         query = text("""
             SELECT 
                 p.*,
-                COALESCE(COUNT(DISTINCT pl.user_id), 0) as like_count,
-                COALESCE(COUNT(DISTINCT c.comment_id), 0) as comment_count,
                 CASE 
                     WHEN :user_id IS NOT NULL THEN 
                         EXISTS(
@@ -192,10 +252,17 @@ class PostRepository:
                     ELSE FALSE 
                 END as liked_by_user
             FROM Posts p
-            LEFT JOIN PostLikes pl ON p.post_id = pl.post_id
-            LEFT JOIN Comments c ON p.post_id = c.post_id
+            JOIN Users u ON p.user_id = u.user_id
+            LEFT JOIN Follows f ON f.follower_id = :user_id
+                AND f.following_id = p.user_id
+                AND f.status_id = 2
             WHERE p.post_id = :post_id
-            GROUP BY p.post_id, p.user_id, p.community_id, p.content, p.media_url, p.created_at
+              AND (
+                  :user_id IS NULL
+                  OR p.user_id = :user_id
+                  OR NOT u.is_private
+                  OR f.follower_id IS NOT NULL
+              )
         """)
         
         result = self.db.session.execute(query, {
@@ -215,13 +282,15 @@ class PostRepository:
         return None
 
     def get_by_user_id_with_stats(self, user_id: int, current_user_id: Optional[int] = None, 
-                                   limit: int = 50, offset: int = 0) -> List[Dict]:
-        """Get all posts by a specific user with engagement metrics"""
+                                   limit: int = 50, offset: int = 0) -> Tuple[List[Dict], int]:
+        """Get a page of a user's posts with engagement metrics, plus the user's total post count
+        
+        The total rides along on every row (COUNT(*) OVER ()), so no separate count query is needed.
+        """
         query = text("""
             SELECT 
                 p.*,
-                COALESCE(COUNT(DISTINCT pl.user_id), 0) as like_count,
-                COALESCE(COUNT(DISTINCT c.comment_id), 0) as comment_count,
+                COUNT(*) OVER () AS total_count,
                 CASE 
                     WHEN :current_user_id IS NOT NULL THEN 
                         EXISTS(
@@ -231,11 +300,8 @@ class PostRepository:
                     ELSE FALSE 
                 END as liked_by_user
             FROM Posts p
-            LEFT JOIN PostLikes pl ON p.post_id = pl.post_id
-            LEFT JOIN Comments c ON p.post_id = c.post_id
             WHERE p.user_id = :user_id
-            GROUP BY p.post_id, p.user_id, p.community_id, p.content, p.media_url, p.created_at
-            ORDER BY p.created_at DESC 
+            ORDER BY p.created_at DESC, p.post_id DESC 
             LIMIT :limit OFFSET :offset
         """)
         
@@ -245,9 +311,10 @@ class PostRepository:
             "limit": limit,
             "offset": offset
         })
+        rows = result.fetchall()
         
         posts_with_stats = []
-        for row in result.fetchall():
+        for row in rows:
             post = Post.from_row(row)
             posts_with_stats.append({
                 **post.to_dict(),
@@ -255,18 +322,17 @@ class PostRepository:
                 'comment_count': row.comment_count,
                 'liked_by_user': row.liked_by_user
             })
-        return posts_with_stats
+        return posts_with_stats, self._page_total(rows, offset, user_id=user_id)
 
     def get_by_community_id_with_stats(self, community_id: int, current_user_id: Optional[int] = None,
-                                       limit: int = 50, offset: int = 0) -> List[Dict]:
-        """Get all posts in a specific community with engagement metrics"""
+                                       limit: int = 50, offset: int = 0) -> Tuple[List[Dict], int]:
+        """Get a page of a community's posts with engagement metrics, plus the community's total post count"""
         query = text("""
             SELECT 
                 p.*,
+                COUNT(*) OVER () AS total_count,
                 u.username,
                 u.profile_picture_url as user_profile_picture,
-                COALESCE(COUNT(DISTINCT pl.user_id), 0) as like_count,
-                COALESCE(COUNT(DISTINCT c.comment_id), 0) as comment_count,
                 CASE 
                     WHEN :current_user_id IS NOT NULL THEN 
                         EXISTS(
@@ -277,11 +343,8 @@ class PostRepository:
                 END as liked_by_user
             FROM Posts p
             JOIN Users u ON p.user_id = u.user_id
-            LEFT JOIN PostLikes pl ON p.post_id = pl.post_id
-            LEFT JOIN Comments c ON p.post_id = c.post_id
             WHERE p.community_id = :community_id
-            GROUP BY p.post_id, u.username, u.profile_picture_url
-            ORDER BY p.created_at DESC 
+            ORDER BY p.created_at DESC, p.post_id DESC 
             LIMIT :limit OFFSET :offset
         """)
         
@@ -291,9 +354,10 @@ class PostRepository:
             "limit": limit,
             "offset": offset
         })
+        rows = result.fetchall()
         
         posts_with_stats = []
-        for row in result.fetchall():
+        for row in rows:
             post = Post.from_row(row)
             posts_with_stats.append({
                 **post.to_dict(),
@@ -303,32 +367,39 @@ class PostRepository:
                 'comment_count': row.comment_count,
                 'liked_by_user': row.liked_by_user
             })
-        return posts_with_stats
+        return posts_with_stats, self._page_total(rows, offset, community_id=community_id)
+
+    def _page_total(self, rows, offset: int, user_id: Optional[int] = None,
+                    community_id: Optional[int] = None) -> int:
+        """Total row count from a page carrying COUNT(*) OVER () as total_count.
+        An empty page past the end has no row to carry it, so fall back to a count query."""
+        if rows:
+            return rows[0].total_count
+        if offset:
+            return self.count(user_id=user_id, community_id=community_id)
+        return 0
 
     def get_feed_with_stats(self, user_id: int, limit: int = 50, offset: int = 0) -> List[Dict]:
-        """Get feed posts with engagement metrics (accepted follows only)
+        """Get feed posts with engagement metrics (own posts and accepted follows)
         
         OPTIMIZED: Single query with JOINs to avoid N+1 problem
         - Fetches user info with JOIN (not separate queries)
-        - Batches like counts with subquery
-        - Batches comment counts with subquery
+        - Visibility is decided in WHERE, before LIMIT, so pages are always full
+        - Like/comment counts are the trigger-maintained columns on Posts
         """
         query = text("""
             SELECT 
                 p.post_id, p.user_id, p.community_id, p.content, p.media_url, p.created_at, p.updated_at,
                 u.username AS author_username, u.profile_picture_url AS author_profile_picture,
-                COALESCE(COUNT(DISTINCT pl.user_id), 0) AS like_count,
-                COALESCE(COUNT(DISTINCT c.comment_id), 0) AS comment_count,
+                p.like_count, p.comment_count,
                 EXISTS(SELECT 1 FROM PostLikes pl2 WHERE pl2.post_id = p.post_id AND pl2.user_id = :user_id) as liked_by_user
             FROM Posts p
             JOIN Users u ON p.user_id = u.user_id
-            INNER JOIN Follows f ON p.user_id = f.following_id
-            LEFT JOIN PostLikes pl ON p.post_id = pl.post_id
-            LEFT JOIN Comments c ON p.post_id = c.post_id
-            WHERE f.follower_id = :user_id 
-              AND f.status_id = (SELECT status_id FROM FollowStatus WHERE status_name = 'accepted')
-            GROUP BY p.post_id, u.username, u.profile_picture_url
-            ORDER BY p.created_at DESC 
+            LEFT JOIN Follows f ON f.follower_id = :user_id
+                AND f.following_id = p.user_id
+                AND f.status_id = 2
+            WHERE p.user_id = :user_id OR f.follower_id IS NOT NULL
+            ORDER BY p.created_at DESC, p.post_id DESC 
             LIMIT :limit OFFSET :offset
         """)
         
@@ -352,12 +423,21 @@ class PostRepository:
         return posts_with_stats
 
     def get_popular(self, user_id: int, limit: int = 50, offset: int = 0) -> List[Dict]:
-        """Get popular posts from the view with liked_by_user status"""
+        """Get popular posts from the view with liked_by_user status
+        
+        Private authors' posts are only included for the author and their accepted
+        followers; the view carries author_is_private so no extra Users lookup is needed.
+        """
         query = text("""
             SELECT 
                 p.*,
                 EXISTS(SELECT 1 FROM PostLikes pl WHERE pl.post_id = p.post_id AND pl.user_id = :user_id) as liked_by_user
             FROM popular_posts_view p
+            LEFT JOIN Follows f ON f.follower_id = :user_id
+                AND f.following_id = p.user_id
+                AND f.status_id = 2
+            WHERE NOT p.author_is_private OR p.user_id = :user_id OR f.follower_id IS NOT NULL
+            ORDER BY p.engagement_score DESC, p.created_at DESC, p.post_id DESC
             LIMIT :limit OFFSET :offset
         """)
         
@@ -394,7 +474,7 @@ class PostRepository:
         """Get trending hashtags from recent posts"""
         # Fetch recent posts to analyze hashtags
         # Limiting to last 1000 posts for performance on large datasets
-        query = text("SELECT content FROM Posts ORDER BY created_at DESC LIMIT 1000")
+        query = text("SELECT content FROM Posts ORDER BY created_at DESC, post_id DESC LIMIT 1000")
         result = self.db.session.execute(query)
         
         hashtag_counts = {}
@@ -425,16 +505,11 @@ class PostRepository:
                 p.*,
                 u.username,
                 u.profile_picture_url as user_profile_picture,
-                COALESCE(COUNT(DISTINCT pl.user_id), 0) as like_count,
-                COALESCE(COUNT(DISTINCT c.comment_id), 0) as comment_count,
                 FALSE as liked_by_user
             FROM Posts p
             JOIN Users u ON p.user_id = u.user_id
-            LEFT JOIN PostLikes pl ON p.post_id = pl.post_id
-            LEFT JOIN Comments c ON p.post_id = c.post_id
             WHERE p.content ILIKE :search
-            GROUP BY p.post_id, u.username, u.profile_picture_url
-            ORDER BY p.created_at DESC 
+            ORDER BY p.created_at DESC, p.post_id DESC 
             LIMIT :limit OFFSET :offset
         """)
         
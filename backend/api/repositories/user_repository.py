@@ -2,8 +2,23 @@ from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from api.extensions import db
 from api.entities.entities import User
+from api.services import cache
 from typing import Optional, List
 
+# Columns of User.to_dict(); listings select just these instead of SELECT *
+_PUBLIC_COLUMNS = "u.user_id, u.username, u.email, u.bio, u.profile_picture_url, u.is_private, u.created_at, u.updated_at"
+# get_by_id rows go to Redis, so they carry the counters but never password_hash
+_CACHED_COLUMNS = f"{_PUBLIC_COLUMNS}, u.followers_count, u.following_count"
+
+
+def _public_dict(row) -> dict:
+    """Build the same dict as User.to_dict() straight from a projected row"""
+    data = dict(row._mapping)
+    for field in ('created_at', 'updated_at'):
+        if data[field]:
+            data[field] = data[field].isoformat()
+    return data
+
 
 class UserRepository:
     def __init__(self):
@@ -26,8 +41,11 @@ class UserRepository:
                 "profile_picture_url": user.profile_picture_url,
                 "is_private": user.is_private
             })
+            created = User.from_row(result.fetchone())
             self.db.session.commit()
-            return User.from_row(result.fetchone())
+            # Misses are never cached, but an id reused after RESTART IDENTITY could still have an entry
+            cache.invalidate_user(created.user_id)
+            return created
         except IntegrityError:
             self.db.session.rollback()
             raise ValueError("Username or email already exists")
@@ -36,48 +54,77 @@ class UserRepository:
             raise
 
     def get_by_id(self, user_id: int) -> Optional[User]:
-        """Get user by ID"""
-        query = text("SELECT * FROM Users WHERE user_id = :user_id")
+        """Get user by ID (read through the Redis cache when configured).
+        password_hash is never loaded here; login reads it by username straight from SQL."""
+        cached = cache.get_user(user_id)
+        if cached:
+            return cached
+        
+        query = text(f"SELECT {_CACHED_COLUMNS} FROM Users u WHERE u.user_id = :user_id")
         result = self.db.session.execute(query, {"user_id": user_id})
-        return User.from_row(result.fetchone())
+        user = User.from_row(result.fetchone())
+        if user:
+            cache.set_user(user)
+        return user
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        query = text("SELECT * FROM Users WHERE email = :email")
+        query = text("SELECT * FROM Users WHERE LOWER(email) = LOWER(:email)")
         result = self.db.session.execute(query, {"email": email})
         return User.from_row(result.fetchone())
 
     def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username"""
-        query = text("SELECT * FROM Users WHERE username = :username")
+        query = text("SELECT * FROM Users WHERE LOWER(username) = LOWER(:username)")
         result = self.db.session.execute(query, {"username": username})
         return User.from_row(result.fetchone())
 
+    def exists_username_or_email(self, username: Optional[str], email: Optional[str],
+                                 exclude_user_id: int) -> dict:
+        """Check in one query whether a username and/or email is taken by another user
+        (case-insensitive). Pass None to skip a field. Returns {"username": bool, "email": bool}."""
+        query = text("""
+            SELECT
+                EXISTS(
+                    SELECT 1 FROM Users
+                    WHERE LOWER(username) = LOWER(:username) AND user_id <> :user_id
+                ) AS username_taken,
+                EXISTS(
+                    SELECT 1 FROM Users
+                    WHERE LOWER(email) = LOWER(:email) AND user_id <> :user_id
+                ) AS email_taken
+        """)
+        row = self.db.session.execute(query, {
+            "username": username,
+            "email": email,
+            "user_id": exclude_user_id
+        }).fetchone()
+        return {"username": row.username_taken, "email": row.email_taken}
+
     def update(self, user: User) -> Optional[User]:
-        """Update an existing user"""
+        """Update an existing user's profile fields (passwords go through update_password_hash)"""
         try:
             query = text("""
                 UPDATE Users 
                 SET username = :username,
                     email = :email,
-                    password_hash = :password_hash,
                     bio = :bio,
                     profile_picture_url = :profile_picture_url,
                     is_private = :is_private
                 WHERE user_id = :user_id
-                RETURNING user_id, username, email, password_hash, bio, profile_picture_url, is_private, created_at, updated_at
+                RETURNING user_id, username, email, bio, profile_picture_url, is_private, created_at, updated_at
             """)
             
             result = self.db.session.execute(query, {
                 "user_id": user.user_id,
                 "username": user.username,
                 "email": user.email,
-                "password_hash": user.password_hash,
                 "bio": user.bio,
                 "profile_picture_url": user.profile_picture_url,
                 "is_private": user.is_private
             })
             self.db.session.commit()
+            cache.invalidate_user(user.user_id)
             return User.from_row(result.fetchone())
         except IntegrityError:
             self.db.session.rollback()
@@ -86,52 +133,109 @@ class UserRepository:
             self.db.session.rollback()
             raise
 
+    def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        """Replace a user's stored password hash"""
+        query = text("UPDATE Users SET password_hash = :password_hash WHERE user_id = :user_id")
+        self.db.session.execute(query, {"user_id": user_id, "password_hash": password_hash})
+        self.db.session.commit()
+        cache.invalidate_user(user_id)
+
     def delete(self, user_id: int) -> bool:
-        """Delete a user by ID"""
-        query = text("DELETE FROM Users WHERE user_id = :user_id RETURNING user_id")
-        result = self.db.session.execute(query, {"user_id": user_id})
+        """Delete a user by ID.
+        The cascaded Follows deletes fire update_user_follow_counts, so the accepted followers
+        and followings are collected in the same statement and their cached rows dropped too."""
+        query = text("""
+            WITH followers AS (
+                SELECT follower_id FROM Follows WHERE following_id = :user_id AND status_id = 2
+            ),
+            followings AS (
+                SELECT following_id FROM Follows WHERE follower_id = :user_id AND status_id = 2
+            ),
+            deleted AS (
+                DELETE FROM Users WHERE user_id = :user_id RETURNING user_id
+            )
+            SELECT
+                EXISTS(SELECT 1 FROM deleted) AS deleted,
+                ARRAY(SELECT follower_id FROM followers) AS follower_ids,
+                ARRAY(SELECT following_id FROM followings) AS following_ids
+        """)
+        row = self.db.session.execute(query, {"user_id": user_id}).fetchone()
         self.db.session.commit()
-        return result.fetchone() is not None
+        cache.invalidate_user(user_id, *row.follower_ids, *row.following_ids)
+        # Followers' cached following sets still list the deleted user
+        cache.invalidate_following(*row.follower_ids)
+        return row.deleted
 
     def get_all(self, limit: int = 100, offset: int = 0) -> List[User]:
         """Get all users with pagination"""
         query = text("""
             SELECT * FROM Users 
-            ORDER BY created_at DESC 
+            ORDER BY created_at DESC, user_id DESC 
             LIMIT :limit OFFSET :offset
         """)
         result = self.db.session.execute(query, {"limit": limit, "offset": offset})
         return [User.from_row(row) for row in result.fetchall()]
 
+    def get_all_dicts(self, limit: int = 100, offset: int = 0) -> List[dict]:
+        """Get a page of users as public dicts (User.to_dict() shape) without building entities"""
+        query = text(f"""
+            SELECT {_PUBLIC_COLUMNS} FROM Users u
+            ORDER BY u.created_at DESC, u.user_id DESC
+            LIMIT :limit OFFSET :offset
+        """)
+        result = self.db.session.execute(query, {"limit": limit, "offset": offset})
+        return [_public_dict(row) for row in result]
+
+    SEARCH_MAX_LIMIT = 100
+    SEARCH_MIN_SUBSTRING_LENGTH = 3
+
     def search(self, query_str: str, limit: int = 20, only_following_for_user_id: Optional[int] = None) -> List[User]:
         """Search users by username using ILIKE for better partial matching"""
-        # Using ILIKE for username prefix search which is more intuitive for autocomplete
+        rows = self._search_rows("u.*", query_str, limit, only_following_for_user_id)
+        return [User.from_row(row) for row in rows]
+
+    def search_dicts(self, query_str: str, limit: int = 20, only_following_for_user_id: Optional[int] = None) -> List[dict]:
+        """Same as search() but returns public dicts (User.to_dict() shape) without building entities"""
+        rows = self._search_rows(_PUBLIC_COLUMNS, query_str, limit, only_following_for_user_id)
+        return [_public_dict(row) for row in rows]
+
+    def _search_rows(self, columns: str, query_str: str, limit: int,
+                     only_following_for_user_id: Optional[int]):
+        query_str = (query_str or "").strip()
+        if not query_str:
+            return []
+        limit = min(limit, self.SEARCH_MAX_LIMIT)
+
+        if len(query_str) < self.SEARCH_MIN_SUBSTRING_LENGTH:
+            # Too short for a useful substring match: username prefix only, served by idx_users_username_lower
+            match_clause = "LOWER(u.username) LIKE :search"
+            search_pattern = f"{query_str.lower()}%"
+        else:
+            match_clause = "(u.username ILIKE :search OR u.bio ILIKE :search)"
+            search_pattern = f"%{query_str}%"
+
         if only_following_for_user_id:
-            query = text("""
-                SELECT u.* FROM Users u
+            query = text(f"""
+                SELECT {columns} FROM Users u
                 JOIN Follows f ON f.following_id = u.user_id
                 WHERE f.follower_id = :current_user_id AND f.status_id = 2
-                AND (u.username ILIKE :search OR u.bio ILIKE :search)
+                AND {match_clause}
                 ORDER BY u.username ASC
                 LIMIT :limit
             """)
-            search_pattern = f"%{query_str}%"
-            result = self.db.session.execute(query, {
+            return self.db.session.execute(query, {
                 "search": search_pattern, 
                 "limit": limit,
                 "current_user_id": only_following_for_user_id
-            })
-            return [User.from_row(row) for row in result.fetchall()]
+            }).fetchall()
         else:
-            query = text("""
-                SELECT * FROM Users 
-                WHERE username ILIKE :search OR bio ILIKE :search
-                ORDER BY username ASC
+            query = text(f"""
+                SELECT {columns} FROM Users u
+                WHERE {match_clause}
+                ORDER BY u.username ASC
                 LIMIT :limit
             """)
-            search_pattern = f"%{query_str}%"
-            result = self.db.session.execute(query, {"search": search_pattern, "limit": limit})
-            return [User.from_row(row) for row in result.fetchall()]
+            return self.db.session.execute(query, {"search": search_pattern, "limit": limit}).fetchall()
 
     def count(self) -> int:
         """Get total user count"""
@@ -140,19 +244,49 @@ class UserRepository:
 
     def exists_by_email(self, email: str) -> bool:
         """Check if email exists"""
-        query = text("SELECT EXISTS(SELECT 1 FROM Users WHERE email = :email)")
+        query = text("SELECT EXISTS(SELECT 1 FROM Users WHERE LOWER(email) = LOWER(:email))")
         return self.db.session.execute(query, {"email": email}).scalar()
 
     def exists_by_username(self, username: str) -> bool:
         """Check if username exists"""
-        query = text("SELECT EXISTS(SELECT 1 FROM Users WHERE username = :username)")
+        query = text("SELECT EXISTS(SELECT 1 FROM Users WHERE LOWER(username) = LOWER(:username))")
         return self.db.session.execute(query, {"username": username}).scalar()
 
     def get_recommendations(self, user_id: int, limit: int = 10) -> List[dict]:
-        """Get friend recommendations for a user"""
+        """Get friend recommendations for a user: accounts followed by the people they follow
+        
+        Same rows and scoring as the advanced_friend_recommendations view, but the friend-of-friend
+        walk starts from this user only instead of building suggestions for every user and
+        filtering afterwards. Follower counts are the trigger-maintained Users.followers_count.
+        """
         query = text("""
-            SELECT * FROM advanced_friend_recommendations 
-            WHERE user_id = :user_id 
+            WITH my_follows AS (
+                SELECT following_id FROM Follows
+                WHERE follower_id = :user_id AND status_id = 2
+            ),
+            suggestions AS (
+                SELECT f.following_id AS suggested_user_id, COUNT(*) AS mutual_count
+                FROM Follows f
+                JOIN my_follows mf ON mf.following_id = f.follower_id
+                WHERE f.status_id = 2
+                  AND f.following_id <> :user_id
+                  AND f.following_id NOT IN (SELECT following_id FROM my_follows)
+                GROUP BY f.following_id
+            )
+            SELECT
+                :user_id AS user_id,
+                s.suggested_user_id,
+                u.username AS suggested_username,
+                s.mutual_count,
+                pc.post_count,
+                u.followers_count AS follower_count,
+                s.mutual_count * 10.0 + pc.post_count * 0.5 + u.followers_count * 0.1 AS recommendation_score
+            FROM suggestions s
+            JOIN Users u ON u.user_id = s.suggested_user_id
+            CROSS JOIN LATERAL (
+                SELECT COUNT(*) AS post_count FROM Posts WHERE user_id = s.suggested_user_id
+            ) pc
+            ORDER BY recommendation_score DESC
             LIMIT :limit
         """)
         
@@ -160,18 +294,4 @@ class UserRepository:
             "user_id": user_id,
             "limit": limit
         })
-        
-        # This view returns: 
-        # user_id, suggested_friend, mutual_count, follower_count, recommendation_score, etc...
-        # We might need to map it nicely or just return dicts.
-        # The view selects: fs.user_id, fs.suggested_friend, fs.mutual_count, fs.recommendation_score
-        # ... and joins Users u on fs.suggested_friend.
-        # It doesn't seem to select username/profile_pic?
-        # Let's verify view definition in init.sql if possible.
-        # But for now, returning dict is safe.
-        
-        recommendations = []
-        for row in result.fetchall():
-            recommendations.append(dict(row._mapping))
-            
-        return recommendations
+        return [dict(row._mapping) for row in result.fetchall()]
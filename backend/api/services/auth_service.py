@@ -1,6 +1,6 @@
 from api.repositories.user_repository import UserRepository
 from api.middleware.jwt import generate_token
-from werkzeug.security import generate_password_hash, check_password_hash
+from api.utils.passwords import hash_password, verify_password, needs_rehash
 from typing import Optional, Dict, Any
 from api.entities.entities import User
 
@@ -19,7 +19,7 @@ class AuthService:
         if self.user_repository.get_by_email(email):
             return {"success": False, "error": "Email already exists"}
 
-        password_hash = generate_password_hash(password)
+        password_hash = hash_password(password)
 
         # Auto-generate avatar if not provided
         if not profile_picture_url:
@@ -57,9 +57,13 @@ class AuthService:
         if not user:
             return {"success": False, "error": "Invalid username or password"}
 
-        if not check_password_hash(user.password_hash, password):
+        if not verify_password(user.password_hash, password):
             return {"success": False, "error": "Invalid username or password"}
 
+        # Upgrade hashes made before the switch to argon2 (or with older parameters)
+        if needs_rehash(user.password_hash):
+            self.user_repository.update_password_hash(user.user_id, hash_password(password))
+
         token = generate_token(user.user_id, user.username)
 
         return {
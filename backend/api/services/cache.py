@@ -0,0 +1,195 @@
+"""Optional Redis cache-aside helpers.
+
+Caching is only active when REDIS_URL is configured and the redis package is
+installed; otherwise every helper is a no-op and callers fall through to Postgres.
+Redis errors are swallowed for the same reason: the cache must never break a request.
+"""
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import Optional
+
+from flask import current_app
+
+from api.entities.entities import User
+
+try:
+    import redis
+except ImportError:  # redis is optional
+    redis = None
+
+USER_TTL_SECONDS = 300
+UNREAD_COUNT_TTL_SECONDS = 60
+FOLLOWING_TTL_SECONDS = 60
+
+# Redis can't store an empty set, so every cached following set carries this member
+# (user ids start at 1) to tell "follows nobody" apart from a cache miss
+_FOLLOWING_SENTINEL = 0
+
+# Only adjust a counter that is already cached; a missing key is repopulated from SQL,
+# so incrementing it here would race with that first read
+_INCR_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return nil
+"""
+
+
+def get_client():
+    """Get the app's shared Redis client, or None when caching is disabled"""
+    if redis is None:
+        return None
+    url = current_app.config.get('REDIS_URL')
+    if not url:
+        return None
+    client = current_app.extensions.get('redis')
+    if client is None:
+        client = redis.Redis.from_url(url)
+        current_app.extensions['redis'] = client
+    return client
+
+
+def _user_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def get_user(user_id: int) -> Optional[User]:
+    """Get a cached user row, or None on a miss"""
+    client = get_client()
+    if client is None:
+        return None
+    try:
+        raw = client.get(_user_key(user_id))
+    except redis.RedisError:
+        return None
+    if raw is None:
+        return None
+    data = json.loads(raw)
+    for field in ('created_at', 'updated_at'):
+        if data.get(field):
+            data[field] = datetime.fromisoformat(data[field])
+    return User(**data)
+
+
+def set_user(user: User) -> None:
+    """Cache a user row; password_hash is never written to Redis"""
+    client = get_client()
+    if client is None:
+        return
+    data = asdict(user)
+    data.pop('password_hash', None)
+    for field in ('created_at', 'updated_at'):
+        if data.get(field):
+            data[field] = data[field].isoformat()
+    try:
+        client.setex(_user_key(user.user_id), USER_TTL_SECONDS, json.dumps(data))
+    except redis.RedisError:
+        pass
+
+
+def invalidate_user(*user_ids: int) -> None:
+    """Drop cached user rows after a write that changes them"""
+    client = get_client()
+    if client is None or not user_ids:
+        return
+    try:
+        client.delete(*[_user_key(user_id) for user_id in user_ids])
+    except redis.RedisError:
+        pass
+
+
+def _unread_key(user_id: int) -> str:
+    return f"unread:{user_id}"
+
+
+def get_unread_count(user_id: int) -> Optional[int]:
+    """Get a cached unread message count, or None on a miss"""
+    client = get_client()
+    if client is None:
+        return None
+    try:
+        raw = client.get(_unread_key(user_id))
+    except redis.RedisError:
+        return None
+    return int(raw) if raw is not None else None
+
+
+def set_unread_count(user_id: int, count: int) -> None:
+    """Cache an unread message count read from the database"""
+    client = get_client()
+    if client is None:
+        return
+    try:
+        client.setex(_unread_key(user_id), UNREAD_COUNT_TTL_SECONDS, count)
+    except redis.RedisError:
+        pass
+
+
+def incr_unread_count(user_id: int, amount: int = 1) -> None:
+    """Adjust a cached unread count in place (no-op when it isn't cached)"""
+    client = get_client()
+    if client is None:
+        return
+    try:
+        client.eval(_INCR_IF_EXISTS, 1, _unread_key(user_id), amount)
+    except redis.RedisError:
+        invalidate_unread_count(user_id)
+
+
+def invalidate_unread_count(*user_ids: int) -> None:
+    """Drop cached unread counts so the next read goes to the database"""
+    client = get_client()
+    if client is None or not user_ids:
+        return
+    try:
+        client.delete(*[_unread_key(user_id) for user_id in user_ids])
+    except redis.RedisError:
+        pass
+
+
+def _following_key(user_id: int) -> str:
+    return f"following:{user_id}"
+
+
+def is_following(follower_id: int, following_id: int) -> Optional[bool]:
+    """Check the cached set of accepted followings, or None on a miss"""
+    client = get_client()
+    if client is None:
+        return None
+    key = _following_key(follower_id)
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.exists(key)
+        pipe.sismember(key, following_id)
+        exists, member = pipe.execute()
+    except redis.RedisError:
+        return None
+    return bool(member) if exists else None
+
+
+def set_following(user_id: int, following_ids) -> None:
+    """Cache the ids a user follows (accepted follows only)"""
+    client = get_client()
+    if client is None:
+        return
+    key = _following_key(user_id)
+    try:
+        pipe = client.pipeline()
+        pipe.delete(key)
+        pipe.sadd(key, _FOLLOWING_SENTINEL, *following_ids)
+        pipe.expire(key, FOLLOWING_TTL_SECONDS)
+        pipe.execute()
+    except redis.RedisError:
+        pass
+
+
+def invalidate_following(*user_ids: int) -> None:
+    """Drop cached following sets after a follow is created, accepted, rejected or removed"""
+    client = get_client()
+    if client is None or not user_ids:
+        return
+    try:
+        client.delete(*[_following_key(user_id) for user_id in user_ids])
+    except redis.RedisError:
+        pass
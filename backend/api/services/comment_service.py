@@ -48,18 +48,11 @@ class CommentService:
 
     def get_post_comments(self, post_id: int, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
         """Get all top-level comments for a specific post with reply counts"""
-        comments = self.comment_repository.get_by_post_id(post_id, limit, offset)
+        comments = self.comment_repository.get_by_post_id_with_reply_counts(post_id, limit, offset)
         total = self.comment_repository.count_by_post_id(post_id)
         
-        # Add reply count to each comment
-        comments_with_replies = []
-        for comment in comments:
-            comment_dict = comment.to_dict()
-            comment_dict['reply_count'] = self.comment_repository.count_replies(comment.comment_id)
-            comments_with_replies.append(comment_dict)
-        
         return {
-            "comments": comments_with_replies,
+            "comments": comments,
             "total": total,
             "limit": limit,
             "offset": offset
@@ -152,19 +145,12 @@ class CommentService:
         if not comment:
             return {"success": False, "error": "Comment not found"}
         
-        replies = self.comment_repository.get_replies(comment_id, limit, offset)
+        replies = self.comment_repository.get_replies_with_reply_counts(comment_id, limit, offset)
         total = self.comment_repository.count_replies(comment_id)
         
-        # Add reply count to each reply (for nested replies)
-        replies_with_counts = []
-        for reply in replies:
-            reply_dict = reply.to_dict()
-            reply_dict['reply_count'] = self.comment_repository.count_replies(reply.comment_id)
-            replies_with_counts.append(reply_dict)
-        
         return {
             "success": True,
-            "replies": replies_with_counts,
+            "replies": replies,
             "total": total,
             "limit": limit,
             "offset": offset
@@ -100,13 +100,11 @@ class CommunityService:
         if not community:
             raise ValueError("Community not found")
         
-        # Check if user is already a member
-        existing_member = self.community_repository.get_member(community_id, user_id)
-        if existing_member:
+        # Add user as member (role_id=3); no row back means they were already a member
+        member = self.community_repository.add_member(community_id, user_id, role_id=3)
+        if not member:
             raise ValueError("You are already a member of this community")
         
-        # Add user as member (role_id=3)
-        member = self.community_repository.add_member(community_id, user_id, role_id=3)
         return member.to_dict()
     
     def leave_community(self, community_id: int, user_id: int) -> bool:
@@ -118,21 +116,17 @@ class CommunityService:
         if not community:
             raise ValueError("Community not found")
         
-        # Check if user is a member
+        # Delete in one statement; the only admin is never removed
+        removed_role_id = self.community_repository.remove_member_unless_last_admin(community_id, user_id)
+        if removed_role_id is not None:
+            return True
+        
+        # Nothing was deleted: either not a member or the only admin
         member = self.community_repository.get_member(community_id, user_id)
         if not member:
             raise ValueError("You are not a member of this community")
         
-        # Don't allow creator/admin to leave if they are the only admin
-        if member.role_id == 1:  # admin
-            # Count how many admins are in the community
-            members = self.community_repository.get_members(community_id, limit=1000)
-            admin_count = sum(1 for m in members if m.get('role_id') == 1)
-            
-            if admin_count == 1:
-                raise ValueError("You are the only admin. Assign another admin before leaving or delete the community")
-        
-        return self.community_repository.remove_member(community_id, user_id)
+        raise ValueError("You are the only admin. Assign another admin before leaving or delete the community")
     
     def remove_member(self, community_id: int, user_id: int, target_user_id: int) -> bool:
         """
@@ -143,7 +137,12 @@ class CommunityService:
         if not community:
             raise ValueError("Community not found")
         
-        # Check if requester is a member and get their role
+        # Delete in one statement; the permission rules are part of the WHERE clause
+        removed_role_id = self.community_repository.remove_member_as(community_id, user_id, target_user_id)
+        if removed_role_id is not None:
+            return True
+        
+        # Nothing was deleted: work out which rule stopped it
         requester_member = self.community_repository.get_member(community_id, user_id)
         if not requester_member:
             raise ValueError("You are not a member of this community")
@@ -165,7 +164,7 @@ class CommunityService:
         if requester_member.role_id == 2 and target_member.role_id == 1:
             raise ValueError("Moderators cannot remove admins")
         
-        return self.community_repository.remove_member(community_id, target_user_id)
+        return False
     
     def change_member_role(self, community_id: int, user_id: int, target_user_id: int, new_role_id: int) -> Dict[str, Any]:
         """
@@ -196,8 +195,7 @@ class CommunityService:
         
         # Don't allow changing the creator's role if they are the only admin
         if target_user_id == community.creator_id and target_member.role_id == 1:
-            members = self.community_repository.get_members(community_id, limit=1000)
-            admin_count = sum(1 for m in members if m.get('role_id') == 1)
+            admin_count = self.community_repository.count_members(community_id, role_id=1)
             
             if admin_count == 1 and new_role_id != 1:
                 raise ValueError("Cannot change role of the only admin. Assign another admin first")
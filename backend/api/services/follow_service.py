@@ -1,6 +1,5 @@
 from api.repositories.follow_repository import FollowRepository
 from api.repositories.user_repository import UserRepository
-from api.entities.entities import Follow
 from typing import Dict, Any, List
 
 
@@ -15,46 +14,25 @@ class FollowService:
         if follower_id == following_id:
             return {"success": False, "error": "Cannot follow yourself"}
         
-        # Check if following user exists
-        following_user = self.user_repository.get_by_id(following_id)
-        if not following_user:
-            return {"success": False, "error": "User not found"}
-        
-        # Check if already following
-        existing = self.follow_repository.get_by_ids(follower_id, following_id)
-        if existing:
-            if existing.status_id == 2:  # accepted
-                return {"success": False, "error": "Already following this user"}
-            elif existing.status_id == 1:  # pending
-                return {"success": False, "error": "Follow request already pending"}
-            elif existing.status_id == 3:  # rejected
-                # Allow re-requesting after rejection
-                updated = self.follow_repository.update_status(follower_id, following_id, 1)
-                return {
-                    "success": True,
-                    "message": "Follow request sent",
-                    "status": "pending",
-                    "follow": updated.to_dict()
-                }
-        
-        # Determine status based on privacy
+        # Insert, or re-request after rejection, in one statement
         # status_id: 1=pending, 2=accepted
-        status_id = 1 if following_user.is_private else 2
-        
-        follow = Follow(
-            follower_id=follower_id,
-            following_id=following_id,
-            status_id=status_id
-        )
+        follow = self.follow_repository.upsert_follow_request(follower_id, following_id)
         
-        created_follow = self.follow_repository.create(follow)
+        if follow:
+            return {
+                "success": True,
+                "message": "Follow request sent" if follow.status_id == 1 else "Now following",
+                "status": "pending" if follow.status_id == 1 else "accepted",
+                "follow": follow.to_dict()
+            }
         
-        return {
-            "success": True,
-            "message": "Follow request sent" if status_id == 1 else "Now following",
-            "status": "pending" if status_id == 1 else "accepted",
-            "follow": created_follow.to_dict()
-        }
+        # Nothing changed: work out why
+        existing = self.follow_repository.get_by_ids(follower_id, following_id)
+        if not existing:
+            return {"success": False, "error": "User not found"}
+        if existing.status_id == 2:  # accepted
+            return {"success": False, "error": "Already following this user"}
+        return {"success": False, "error": "Follow request already pending"}
 
     def unfollow_user(self, follower_id: int, following_id: int) -> Dict[str, Any]:
         """Unfollow a user"""
@@ -125,12 +103,11 @@ class FollowService:
         return requests
 
     def get_follow_stats(self, user_id: int) -> Dict[str, Any]:
-        """Get follow statistics for a user"""
-        followers_count = self.follow_repository.count_followers(user_id)
-        following_count = self.follow_repository.count_following(user_id)
+        """Get follow statistics for a user (counters are kept on the Users row by trigger)"""
+        user = self.user_repository.get_by_id(user_id)
         
         return {
             "user_id": user_id,
-            "followers_count": followers_count,
-            "following_count": following_count
+            "followers_count": user.followers_count if user else 0,
+            "following_count": user.following_count if user else 0
         }
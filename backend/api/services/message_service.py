@@ -2,7 +2,7 @@ from api.repositories.message_repository import MessageRepository
 from api.repositories.user_repository import UserRepository
 from api.repositories.follow_repository import FollowRepository
 from api.entities.entities import Message
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 class MessageService:
@@ -17,6 +17,11 @@ class MessageService:
         if sender_id == receiver_id:
             return {"success": False, "error": "Cannot send message to yourself"}
         
+        # Reject bad payloads before any database round-trip
+        errors = Message.validate_fields(content, media_url)
+        if errors:
+            return {"success": False, "error": errors[0]}
+        
         # Check if receiver exists
         receiver = self.user_repository.get_by_id(receiver_id)
         if not receiver:
@@ -35,11 +40,6 @@ class MessageService:
             is_read=False
         )
         
-        # Validate message
-        errors = message.validate()
-        if errors:
-            return {"success": False, "error": errors[0]}
-        
         # Create message
         created_message = self.message_repository.create(message)
         
@@ -48,24 +48,24 @@ class MessageService:
             "message": created_message.to_dict()
         }
 
-    def get_conversation(self, user_id: int, other_user_id: int, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
-        """Get conversation between current user and another user"""
-        # Check if other user exists
-        other_user = self.user_repository.get_by_id(other_user_id)
-        if not other_user:
+    def get_conversation(self, user_id: int, other_user_id: int, limit: int = 50, offset: int = 0,
+                         before_id: Optional[int] = None) -> Dict[str, Any]:
+        """Get conversation between current user and another user (keyset paginated via before_id)"""
+        # The other user's profile comes back with the messages; None means they don't exist
+        conversation = self.message_repository.get_conversation_with_user(
+            user_id, other_user_id, limit, offset, before_id
+        )
+        if not conversation:
             return {"success": False, "error": "User not found"}
         
-        messages = self.message_repository.get_conversation(user_id, other_user_id, limit, offset)
+        messages = conversation["messages"]
         
         return {
             "success": True,
             "messages": [msg.to_dict() for msg in messages],
             "count": len(messages),
-            "other_user": {
-                "user_id": other_user.user_id,
-                "username": other_user.username,
-                "profile_picture_url": other_user.profile_picture_url
-            }
+            "next_cursor": messages[-1].message_id if len(messages) == limit else None,
+            "other_user": conversation["other_user"]
         }
 
     def get_conversations(self, user_id: int, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
@@ -84,7 +84,7 @@ class MessageService:
                     "content": conv["content"],
                     "created_at": conv["created_at"].isoformat() if conv["created_at"] else None
                 },
-                "unread_count": 0 # TODO: Implement unread count per conversation
+                "unread_count": conv["unread_count"]
             })
             
         return {
@@ -113,6 +113,15 @@ class MessageService:
             "message": updated_message.to_dict()
         }
 
+    def mark_conversation_read(self, user_id: int, other_user_id: int) -> Dict[str, Any]:
+        """Mark every unread message from another user as read (single UPDATE)"""
+        updated = self.message_repository.mark_conversation_as_read(user_id, other_user_id)
+        
+        return {
+            "success": True,
+            "marked_count": updated
+        }
+
     def delete_message(self, message_id: int, user_id: int) -> Dict[str, Any]:
         """Delete a message (only sender can delete)"""
         message = self.message_repository.get_by_id(message_id)
@@ -30,29 +30,21 @@ class PostService:
         # Save to database
         created_post = self.post_repository.create(post)
         
-        # Get post with engagement metrics (will be 0 for new posts)
-        post_with_stats = self.post_repository.get_with_stats(created_post.post_id, user_id)
-        
+        # A new post has no engagement yet; RETURNING already carries the counter columns
         return {
             "success": True,
-            "post": post_with_stats
+            "post": {
+                **created_post.to_dict(),
+                "like_count": created_post.like_count,
+                "comment_count": created_post.comment_count,
+                "liked_by_user": False
+            }
         }
 
     def get_post(self, post_id: int, user_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """Get post by ID with engagement metrics and user's interaction status (with privacy check)"""
-        # Use the new get_with_stats method
-        post_dict = self.post_repository.get_with_stats(post_id, user_id)
-        
-        if post_dict:
-            # Get the basic post to check privacy
-            post = self.post_repository.get_by_id(post_id)
-            
-            # Check if user can view this post
-            if user_id and not self.can_view_post(post, user_id):
-                return None
-            
-            return post_dict
-        return None
+        # The privacy check is part of the query: posts the user can't see come back as None
+        return self.post_repository.get_with_stats(post_id, user_id)
 
     def get_user_posts(self, user_id: int, current_user_id: int = None, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
         """Get all posts by a specific user with engagement metrics (filtered by privacy)"""
@@ -61,8 +53,7 @@ class PostService:
             post_author = self.user_repository.get_by_id(user_id)
             if post_author and post_author.is_private:
                 # Check if current user is an accepted follower
-                follow = self.follow_repository.get_by_ids(current_user_id, user_id)
-                if not follow or follow.status_id != 2:
+                if not self._is_accepted_follower(current_user_id, user_id):
                     return {
                         "posts": [],
                         "total": 0,
@@ -71,9 +62,8 @@ class PostService:
                         "message": "This account is private"
                     }
         
-        # Use the new method with stats
-        posts = self.post_repository.get_by_user_id_with_stats(user_id, current_user_id, limit, offset)
-        total = self.post_repository.count(user_id=user_id)
+        # The page and the total come back from a single query
+        posts, total = self.post_repository.get_by_user_id_with_stats(user_id, current_user_id, limit, offset)
         
         return {
             "posts": posts,
@@ -84,8 +74,7 @@ class PostService:
 
     def get_community_posts(self, community_id: int, current_user_id: int = None, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
         """Get all posts in a specific community with engagement metrics"""
-        posts = self.post_repository.get_by_community_id_with_stats(community_id, current_user_id, limit, offset)
-        total = self.post_repository.count(community_id=community_id)
+        posts, total = self.post_repository.get_by_community_id_with_stats(community_id, current_user_id, limit, offset)
         
         return {
             "posts": posts,
@@ -131,46 +120,26 @@ class PostService:
 
     def delete_post(self, post_id: int, user_id: int) -> Dict[str, Any]:
         """Delete a post with ownership validation"""
-        # Get existing post
+        # Ownership is part of the DELETE; only look the post up to explain a miss
+        if self.post_repository.delete_owned(post_id, user_id):
+            return {"success": True, "message": "Post deleted successfully"}
+        
         post = self.post_repository.get_by_id(post_id)
         if not post:
             return {"success": False, "error": "Post not found"}
         
-        # Ownership validation
-        if post.user_id != user_id:
-            return {"success": False, "error": "You can only delete your own posts"}
-        
-        # Delete post
-        deleted = self.post_repository.delete(post_id)
-        
-        if deleted:
-            return {"success": True, "message": "Post deleted successfully"}
-        return {"success": False, "error": "Failed to delete post"}
+        return {"success": False, "error": "You can only delete your own posts"}
 
     def get_feed(self, user_id: int, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
-        """Get authenticated user's feed with engagement metrics (posts from accepted follows only)
+        """Get authenticated user's feed with engagement metrics (own posts and accepted follows)
         
-        OPTIMIZED: No N+1 queries
-        - User info fetched in single query with JOIN
-        - Privacy filtering done in single pass (no additional queries)
+        Visibility is decided by the query itself, so no per-post privacy lookups are
+        needed and the page size is exactly what the database returned.
         """
-        # Use the optimized feed method - includes user info in single query
         posts = self.post_repository.get_feed_with_stats(user_id, limit, offset)
         
-        # Filter posts based on privacy (already have user info, no extra queries)
-        filtered_posts = []
-        for post_dict in posts:
-            # User info already fetched with JOIN - no additional query
-            is_private = post_dict.get('is_private', False)
-            post_user_id = post_dict['user_id']
-            
-            # Include if: own post, public user, or accepted follow (already verified in query)
-            if post_user_id == user_id or not is_private:
-                # Accepted follow already verified by query JOIN condition
-                filtered_posts.append(post_dict)
-        
         return {
-            "posts": filtered_posts,
+            "posts": posts,
             "limit": limit,
             "offset": offset
         }
@@ -202,55 +171,39 @@ class PostService:
 
     def like_post(self, post_id: int, user_id: int) -> Dict[str, Any]:
         """Like a post with validation"""
-        # Get post
-        post = self.post_repository.get_by_id(post_id)
-        if not post:
+        # Existence check, insert and fresh counts happen in a single statement
+        result = self.post_repository.like_post_with_stats(post_id, user_id)
+        if not result['post_exists']:
             return {"success": False, "error": "Post not found"}
         
-        # Check if already liked
-        if self.post_repository.has_user_liked(post_id, user_id):
+        if not result['changed']:
             return {"success": False, "error": "You have already liked this post"}
         
-        # Add like
-        success = self.post_repository.like_post(post_id, user_id)
-        
-        if success:
-            # Get updated stats
-            post_with_stats = self.post_repository.get_with_stats(post_id, user_id)
-            return {
-                "success": True,
-                "message": "Post liked successfully",
-                "like_count": post_with_stats['like_count'],
-                "comment_count": post_with_stats['comment_count'],
-                "liked_by_user": post_with_stats['liked_by_user']
-            }
-        return {"success": False, "error": "Failed to like post"}
+        return {
+            "success": True,
+            "message": "Post liked successfully",
+            "like_count": result['like_count'],
+            "comment_count": result['comment_count'],
+            "liked_by_user": True
+        }
 
     def unlike_post(self, post_id: int, user_id: int) -> Dict[str, Any]:
         """Unlike a post"""
-        # Get post
-        post = self.post_repository.get_by_id(post_id)
-        if not post:
+        # Existence check, delete and fresh counts happen in a single statement
+        result = self.post_repository.unlike_post_with_stats(post_id, user_id)
+        if not result['post_exists']:
             return {"success": False, "error": "Post not found"}
         
-        # Check if liked
-        if not self.post_repository.has_user_liked(post_id, user_id):
+        if not result['changed']:
             return {"success": False, "error": "You have not liked this post"}
         
-        # Remove like
-        success = self.post_repository.unlike_post(post_id, user_id)
-        
-        if success:
-            # Get updated stats
-            post_with_stats = self.post_repository.get_with_stats(post_id, user_id)
-            return {
-                "success": True,
-                "message": "Post unliked successfully",
-                "like_count": post_with_stats['like_count'],
-                "comment_count": post_with_stats['comment_count'],
-                "liked_by_user": post_with_stats['liked_by_user']
-            }
-        return {"success": False, "error": "Failed to unlike post"}
+        return {
+            "success": True,
+            "message": "Post unliked successfully",
+            "like_count": result['like_count'],
+            "comment_count": result['comment_count'],
+            "liked_by_user": False
+        }
 
     def get_like_count(self, post_id: int) -> Dict[str, Any]:
         """Get like count for a post"""
@@ -259,8 +212,7 @@ class PostService:
         if not post:
             return {"success": False, "error": "Post not found"}
         
-        count = self.post_repository.count_likes(post_id)
-        return {"success": True, "like_count": count}
+        return {"success": True, "like_count": post.like_count}
 
     def get_post_likes(self, post_id: int) -> Dict[str, Any]:
         """Get users who liked a post"""
@@ -296,5 +248,4 @@ class PostService:
 
     def _is_accepted_follower(self, follower_id: int, following_id: int) -> bool:
         """Helper method to check if user is an accepted follower"""
-        follow = self.follow_repository.get_by_ids(follower_id, following_id)
-        return follow is not None and follow.status_id == 2
+        return self.follow_repository.is_following_cached(follower_id, following_id)
@@ -1,7 +1,7 @@
 from api.repositories.user_repository import UserRepository
 from api.repositories.follow_repository import FollowRepository
 from api.entities.entities import User
-from werkzeug.security import generate_password_hash, check_password_hash
+from api.utils.passwords import hash_password
 from typing import Optional, Dict, Any, List
 
 
@@ -33,7 +33,8 @@ class UserService:
                 user_dict['is_following'] = is_following
                 user_dict['has_pending_request'] = has_pending_request
                 
-                can_view = self.can_view_profile(user.user_id, current_user_id)
+                # Same rule as can_view_profile, reusing the follow row fetched above
+                can_view = not user.is_private or is_following
                 user_dict['can_view_profile'] = can_view
                 
                 if user.is_private and not can_view:
@@ -72,20 +73,22 @@ class UserService:
         if not user:
             return {"success": False, "error": "User not found"}
 
-        if "username" in updates and updates["username"] != user.username:
-            existing = self.user_repository.get_by_username(updates["username"])
-            if existing:
-                return {"success": False, "error": "Username already exists"}
-            user.username = updates["username"]
+        new_username = updates["username"] if "username" in updates and updates["username"] != user.username else None
+        new_email = updates["email"] if "email" in updates and updates["email"] != user.email else None
 
-        if "email" in updates and updates["email"] != user.email:
-            existing = self.user_repository.get_by_email(updates["email"])
-            if existing:
+        # Both uniqueness checks share one round-trip
+        if new_username is not None or new_email is not None:
+            taken = self.user_repository.exists_username_or_email(new_username, new_email, user_id)
+            if taken["username"]:
+                return {"success": False, "error": "Username already exists"}
+            if taken["email"]:
                 return {"success": False, "error": "Email already exists"}
-            user.email = updates["email"]
 
-        if "password" in updates:
-            user.password_hash = generate_password_hash(updates["password"])
+        if new_username is not None:
+            user.username = new_username
+
+        if new_email is not None:
+            user.email = new_email
 
         if "bio" in updates:
             user.bio = updates["bio"]
@@ -98,6 +101,9 @@ class UserService:
 
         updated_user = self.user_repository.update(user)
 
+        if "password" in updates:
+            self.user_repository.update_password_hash(user_id, hash_password(updates["password"]))
+
         return {
             "success": True,
             "user": updated_user.to_dict()
@@ -117,13 +123,11 @@ class UserService:
 
     def search_users(self, query: str, limit: int = 20, only_following_for_user_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search users by username"""
-        users = self.user_repository.search(query, limit, only_following_for_user_id)
-        return [user.to_dict() for user in users]
+        return self.user_repository.search_dicts(query, limit, only_following_for_user_id)
 
     def get_all_users(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """Get all users with pagination"""
-        users = self.user_repository.get_all(limit, offset)
-        return [user.to_dict() for user in users]
+        return self.user_repository.get_all_dicts(limit, offset)
 
     def can_view_profile(self, target_user_id: int, current_user_id: int) -> bool:
         """Check if current user can view target user's profile"""
@@ -141,9 +145,7 @@ class UserService:
             return True
         
         # If user is private, check if current user is an accepted follower
-        follow = self.follow_repository.get_by_ids(current_user_id, target_user_id)
-        # status_id = 2 means 'accepted'
-        return follow is not None and follow.status_id == 2
+        return self.follow_repository.is_following(current_user_id, target_user_id)
 
     def get_profile_visibility(self, target_user_id: int, current_user_id: int) -> Dict[str, Any]:
         """Get what current user can see of target user's profile"""
@@ -0,0 +1,66 @@
+"""Password hashing.
+
+New hashes are argon2id (argon2-cffi) when it is installed, falling back to
+Werkzeug's default otherwise. Verification accepts both formats, so hashes created
+before the switch keep working; login upgrades them via needs_rehash().
+
+When the app runs with TESTING set, hashes use the cheapest parameters instead:
+test setup registers many users, and the stored hashes never leave the test database.
+"""
+from flask import current_app, has_app_context
+from werkzeug.security import generate_password_hash, check_password_hash
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi is optional
+    PasswordHasher = None
+
+# OWASP's minimum argon2id profile: 19 MiB, 2 passes, 1 lane
+_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1) if PasswordHasher else None
+# argon2's floor (8 KiB, 1 pass); only ever used under TESTING
+_test_hasher = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1) if PasswordHasher else None
+
+_ARGON2_PREFIX = "$argon2"
+
+
+def _testing() -> bool:
+    return has_app_context() and current_app.config.get('TESTING', False)
+
+
+def _current_hasher():
+    return _test_hasher if _testing() else _hasher
+
+
+def hash_password(password: str) -> str:
+    """Hash a password for storage"""
+    hasher = _current_hasher()
+    if hasher is None:
+        if _testing():
+            return generate_password_hash(password, method="pbkdf2:sha256:1")
+        return generate_password_hash(password)
+    return hasher.hash(password)
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """Check a password against a stored argon2 or Werkzeug hash"""
+    if not password_hash:
+        return False
+    if password_hash.startswith(_ARGON2_PREFIX):
+        if _hasher is None:
+            return False
+        try:
+            return _hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(password_hash, password)
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Whether a stored hash should be replaced with a fresh hash_password() result"""
+    hasher = _current_hasher()
+    if hasher is None:
+        return False
+    if not password_hash.startswith(_ARGON2_PREFIX):
+        return True
+    return hasher.check_needs_rehash(password_hash)
@@ -111,6 +111,42 @@ def escape_sql(s):
     return s.replace("'", "''")
 
 
+def sql_literal(value):
+    """Render a Python value as a SQL literal"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return str(value)
+    return f"'{escape_sql(value)}'"
+
+
+def batch_insert(table, columns, select, aliases, rows, joins="", order_by="v.n"):
+    """Build one set-based INSERT ... SELECT for a whole table.
+
+    Rows are inlined as a VALUES list (first column is the row number, kept for a
+    stable insert order) and foreign keys are resolved by joining the lookup tables
+    once, instead of one INSERT with scalar subqueries per row.
+    """
+    if not rows:
+        return []
+    values = ",\n".join(
+        "    (" + ", ".join(sql_literal(v) for v in (n, *row)) + ")"
+        for n, row in enumerate(rows, start=1)
+    )
+    statement = [
+        f"INSERT INTO {table} ({', '.join(columns)})",
+        f"SELECT {select}",
+        f"FROM (VALUES\n{values}\n) AS v(n, {', '.join(aliases)})",
+    ]
+    if joins:
+        statement.append(joins)
+    statement.append(f"ORDER BY {order_by}")
+    statement.append("ON CONFLICT DO NOTHING;")
+    return ["\n".join(statement)]
+
+
 def generate_username(first, last, idx):
     """Generate a unique username"""
     patterns = [
@@ -158,6 +194,7 @@ def generate_sql():
     all_last_names = LAST_NAMES_TR + LAST_NAMES_EN
     
     used_usernames = set()
+    user_rows = []
     for i in range(50):
         first = random.choice(all_first_names)
         last = random.choice(all_last_names)
@@ -171,13 +208,19 @@ def generate_sql():
         used_usernames.add(username)
         
         email = f"{username}@example.com"
-        bio = escape_sql(random.choice(BIOS))
-        is_private = "TRUE" if i % 8 == 0 else "FALSE"
+        bio = random.choice(BIOS)
+        is_private = i % 8 == 0
         avatar_url = f"http://localhost:5000/static/uploads/{username}_{timestamp_base + i}_default.svg"
         
         users.append(username)
-        lines.append(f"INSERT INTO Users (username, email, password_hash, bio, is_private, profile_picture_url) VALUES ('{username}', '{email}', '{password_hash}', '{bio}', {is_private}, '{avatar_url}') ON CONFLICT DO NOTHING;")
+        user_rows.append((username, email, password_hash, bio, is_private, avatar_url))
     
+    lines.extend(batch_insert(
+        "Users", ["username", "email", "password_hash", "bio", "is_private", "profile_picture_url"],
+        "v.username, v.email, v.password_hash, v.bio, v.is_private, v.profile_picture_url",
+        ["username", "email", "password_hash", "bio", "is_private", "profile_picture_url"],
+        user_rows
+    ))
     lines.append("")
     
     # Generate communities
@@ -187,12 +230,20 @@ def generate_sql():
     lines.append("")
     
     communities = []
+    community_rows = []
     for i, (name, desc) in enumerate(COMMUNITY_NAMES):
         creator = users[i % len(users)]
         privacy = "public" if i % 5 != 0 else "private"
         communities.append(name)
-        lines.append(f"INSERT INTO Communities (name, description, creator_id, privacy_id) VALUES ('{escape_sql(name)}', '{escape_sql(desc)}', (SELECT user_id FROM Users WHERE username='{creator}'), (SELECT privacy_id FROM PrivacyTypes WHERE privacy_name='{privacy}')) ON CONFLICT DO NOTHING;")
+        community_rows.append((name, desc, creator, privacy))
     
+    lines.extend(batch_insert(
+        "Communities", ["name", "description", "creator_id", "privacy_id"],
+        "v.name, v.description, u.user_id, pt.privacy_id",
+        ["name", "description", "creator", "privacy"],
+        community_rows,
+        joins="JOIN Users u ON u.username = v.creator\nJOIN PrivacyTypes pt ON pt.privacy_name = v.privacy"
+    ))
     lines.append("")
     
     # Generate community members (150+)
@@ -201,13 +252,21 @@ def generate_sql():
     lines.append("-- ============================================")
     lines.append("")
     
+    member_rows = []
     for idx, name in enumerate(communities):
         num_members = 10 + (idx % 12)
         for j in range(num_members):
             member = users[(idx * 7 + j) % len(users)]
             role = "moderator" if j < 3 else "member"
-            lines.append(f"INSERT INTO CommunityMembers (community_id, user_id, role_id) VALUES ((SELECT community_id FROM Communities WHERE name='{escape_sql(name)}'), (SELECT user_id FROM Users WHERE username='{member}'), (SELECT role_id FROM Roles WHERE role_name='{role}')) ON CONFLICT DO NOTHING;")
+            member_rows.append((name, member, role))
     
+    lines.extend(batch_insert(
+        "CommunityMembers", ["community_id", "user_id", "role_id"],
+        "c.community_id, u.user_id, r.role_id",
+        ["community", "member", "role"],
+        member_rows,
+        joins="JOIN Communities c ON c.name = v.community\nJOIN Users u ON u.username = v.member\nJOIN Roles r ON r.role_name = v.role"
+    ))
     lines.append("")
     
     # Generate follows (300+)
@@ -216,14 +275,22 @@ def generate_sql():
     lines.append("-- ============================================")
     lines.append("")
     
+    follow_rows = []
     for i, user in enumerate(users):
         num_following = 6 + (i % 12)
         for j in range(num_following):
             target_idx = (i + j + 1) % len(users)
             if target_idx != i:
                 status = "accepted" if j % 5 != 0 else "pending"
-                lines.append(f"INSERT INTO Follows (follower_id, following_id, status_id) VALUES ((SELECT user_id FROM Users WHERE username='{user}'), (SELECT user_id FROM Users WHERE username='{users[target_idx]}'), (SELECT status_id FROM FollowStatus WHERE status_name='{status}')) ON CONFLICT DO NOTHING;")
+                follow_rows.append((user, users[target_idx], status))
     
+    lines.extend(batch_insert(
+        "Follows", ["follower_id", "following_id", "status_id"],
+        "a.user_id, b.user_id, fs.status_id",
+        ["follower", "following", "status"],
+        follow_rows,
+        joins="JOIN Users a ON a.username = v.follower\nJOIN Users b ON b.username = v.following\nJOIN FollowStatus fs ON fs.status_name = v.status"
+    ))
     lines.append("")
     
     # Generate posts with UNIQUE content (number embedded naturally)
@@ -232,8 +299,9 @@ def generate_sql():
     lines.append("-- ============================================")
     lines.append("")
     
-    # Store post data for likes/comments matching - use first 30 chars as unique key
-    post_data = []  # List of (match_prefix, user)
+    # Store post data for likes/comments matching - content is unique (post number embedded)
+    post_data = []  # List of (content, user)
+    post_rows = []
     post_number = 0
     
     for i, user in enumerate(users):
@@ -241,16 +309,18 @@ def generate_sql():
         for j in range(num_posts):
             post_number += 1
             content = generate_unique_post_content(post_number, user)
-            # Use first 30 characters as unique match prefix
-            match_prefix = content[:30]
-            post_data.append((match_prefix, user))
+            post_data.append((content, user))
             
-            if j % 3 == 0 and communities:
-                community = communities[j % len(communities)]
-                lines.append(f"INSERT INTO Posts (user_id, community_id, content) VALUES ((SELECT user_id FROM Users WHERE username='{user}'), (SELECT community_id FROM Communities WHERE name='{escape_sql(community)}'), '{escape_sql(content)}') ON CONFLICT DO NOTHING;")
-            else:
-                lines.append(f"INSERT INTO Posts (user_id, content) VALUES ((SELECT user_id FROM Users WHERE username='{user}'), '{escape_sql(content)}') ON CONFLICT DO NOTHING;")
+            community = communities[j % len(communities)] if j % 3 == 0 and communities else None
+            post_rows.append((user, community, content))
     
+    lines.extend(batch_insert(
+        "Posts", ["user_id", "community_id", "content"],
+        "u.user_id, c.community_id, v.content",
+        ["author", "community", "content"],
+        post_rows,
+        joins="JOIN Users u ON u.username = v.author\nLEFT JOIN Communities c ON c.name = v.community"
+    ))
     lines.append("")
     
     # Generate comments using prefix matching
@@ -259,14 +329,20 @@ def generate_sql():
     lines.append("-- ============================================")
     lines.append("")
     
-    for idx, (match_prefix, author) in enumerate(post_data[:100]):
+    comment_rows = []
+    for idx, (post_content, author) in enumerate(post_data[:100]):
         num_comments = 3 + (idx % 5)
         for j in range(num_comments):
             commenter = users[(idx + j + 5) % len(users)]
-            comment_text = escape_sql(COMMENT_CONTENTS[j % len(COMMENT_CONTENTS)])
-            # Use LIKE with first 30 chars to find post
-            lines.append(f"INSERT INTO Comments (post_id, user_id, content) VALUES ((SELECT post_id FROM Posts WHERE content LIKE '{escape_sql(match_prefix)}%' LIMIT 1), (SELECT user_id FROM Users WHERE username='{commenter}'), '{comment_text}') ON CONFLICT DO NOTHING;")
+            comment_rows.append((post_content, commenter, COMMENT_CONTENTS[j % len(COMMENT_CONTENTS)]))
     
+    lines.extend(batch_insert(
+        "Comments", ["post_id", "user_id", "content"],
+        "p.post_id, u.user_id, v.content",
+        ["post_content", "commenter", "content"],
+        comment_rows,
+        joins="JOIN Posts p ON p.content = v.post_content\nJOIN Users u ON u.username = v.commenter"
+    ))
     lines.append("")
     
     # Generate likes using prefix matching
@@ -275,13 +351,20 @@ def generate_sql():
     lines.append("-- ============================================")
     lines.append("")
     
-    for idx, (match_prefix, author) in enumerate(post_data[:80]):
+    like_rows = []
+    for idx, (post_content, author) in enumerate(post_data[:80]):
         num_likes = 5 + (idx % 10)
         for j in range(num_likes):
             liker = users[(idx + j + 3) % len(users)]
-            # Use LIKE with first 30 chars to find post
-            lines.append(f"INSERT INTO PostLikes (post_id, user_id) VALUES ((SELECT post_id FROM Posts WHERE content LIKE '{escape_sql(match_prefix)}%' LIMIT 1), (SELECT user_id FROM Users WHERE username='{liker}')) ON CONFLICT DO NOTHING;")
+            like_rows.append((post_content, liker))
     
+    lines.extend(batch_insert(
+        "PostLikes", ["post_id", "user_id"],
+        "p.post_id, u.user_id",
+        ["post_content", "liker"],
+        like_rows,
+        joins="JOIN Posts p ON p.content = v.post_content\nJOIN Users u ON u.username = v.liker"
+    ))
     lines.append("")
     
     # Generate messages (200+)
@@ -290,16 +373,24 @@ def generate_sql():
     lines.append("-- ============================================")
     lines.append("")
     
+    message_rows = []
     for i in range(25):
         for j in range(4):
             sender = users[i]
             receiver = users[(i + j + 1) % len(users)]
             if sender != receiver:
                 for k in range(4):
-                    msg = escape_sql(MESSAGE_CONTENTS[k % len(MESSAGE_CONTENTS)])
+                    msg = MESSAGE_CONTENTS[k % len(MESSAGE_CONTENTS)]
                     s, r = (sender, receiver) if k % 2 == 0 else (receiver, sender)
-                    lines.append(f"INSERT INTO Messages (sender_id, receiver_id, content) VALUES ((SELECT user_id FROM Users WHERE username='{s}'), (SELECT user_id FROM Users WHERE username='{r}'), '{msg}') ON CONFLICT DO NOTHING;")
+                    message_rows.append((s, r, msg))
     
+    lines.extend(batch_insert(
+        "Messages", ["sender_id", "receiver_id", "content"],
+        "a.user_id, b.user_id, v.content",
+        ["sender", "receiver", "content"],
+        message_rows,
+        joins="JOIN Users a ON a.username = v.sender\nJOIN Users b ON b.username = v.receiver"
+    ))
     lines.append("")
     lines.append("-- END OF SEED DATA")
     
@@ -44,12 +44,14 @@ CREATE TABLE FollowStatus (
 
 CREATE TABLE Users (
     user_id SERIAL PRIMARY KEY,
-    username VARCHAR(50) UNIQUE NOT NULL,
-    email VARCHAR(100) UNIQUE NOT NULL,
+    username VARCHAR(50) NOT NULL,
+    email VARCHAR(100) NOT NULL,
     password_hash TEXT NOT NULL,
     bio TEXT,
     profile_picture_url TEXT,
     is_private BOOLEAN DEFAULT FALSE,
+    followers_count INT DEFAULT 0,
+    following_count INT DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     CONSTRAINT chk_users_email_format CHECK (email ~* '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
@@ -95,6 +97,8 @@ CREATE TABLE Posts (
     community_id INT REFERENCES Communities(community_id) ON DELETE CASCADE ON UPDATE CASCADE,
     content TEXT,
     media_url TEXT,
+    like_count INT DEFAULT 0,
+    comment_count INT DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     CONSTRAINT chk_posts_content_or_media CHECK ((content IS NOT NULL AND content != '') OR (media_url IS NOT NULL AND media_url != ''))
@@ -165,6 +169,60 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Follow Count Update Trigger Function
+-- Used by: POST /api/users/<id>/follow, DELETE /api/users/<id>/follow, follow request accept/reject
+-- Only accepted follows (status_id = 2) are counted
+CREATE OR REPLACE FUNCTION update_user_follow_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (TG_OP = 'INSERT') THEN
+        IF NEW.status_id = 2 THEN
+            UPDATE Users SET followers_count = followers_count + 1 WHERE user_id = NEW.following_id;
+            UPDATE Users SET following_count = following_count + 1 WHERE user_id = NEW.follower_id;
+        END IF;
+        RETURN NEW;
+    ELSIF (TG_OP = 'DELETE') THEN
+        IF OLD.status_id = 2 THEN
+            UPDATE Users SET followers_count = followers_count - 1 WHERE user_id = OLD.following_id;
+            UPDATE Users SET following_count = following_count - 1 WHERE user_id = OLD.follower_id;
+        END IF;
+        RETURN OLD;
+    ELSIF (TG_OP = 'UPDATE') THEN
+        IF OLD.status_id <> 2 AND NEW.status_id = 2 THEN
+            UPDATE Users SET followers_count = followers_count + 1 WHERE user_id = NEW.following_id;
+            UPDATE Users SET following_count = following_count + 1 WHERE user_id = NEW.follower_id;
+        ELSIF OLD.status_id = 2 AND NEW.status_id <> 2 THEN
+            UPDATE Users SET followers_count = followers_count - 1 WHERE user_id = OLD.following_id;
+            UPDATE Users SET following_count = following_count - 1 WHERE user_id = OLD.follower_id;
+        END IF;
+        RETURN NEW;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Post Engagement Count Trigger Function
+-- Used by: POST/DELETE /api/posts/<id>/like, comment create/delete
+CREATE OR REPLACE FUNCTION update_post_engagement_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (TG_TABLE_NAME = 'postlikes') THEN
+        IF (TG_OP = 'INSERT') THEN
+            UPDATE Posts SET like_count = like_count + 1 WHERE post_id = NEW.post_id;
+        ELSIF (TG_OP = 'DELETE') THEN
+            UPDATE Posts SET like_count = like_count - 1 WHERE post_id = OLD.post_id;
+        END IF;
+    ELSIF (TG_TABLE_NAME = 'comments') THEN
+        IF (TG_OP = 'INSERT') THEN
+            UPDATE Posts SET comment_count = comment_count + 1 WHERE post_id = NEW.post_id;
+        ELSIF (TG_OP = 'DELETE') THEN
+            UPDATE Posts SET comment_count = comment_count - 1 WHERE post_id = OLD.post_id;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
 -- Function: Get friend-of-friend recommendations
 -- Used by: GET /api/features/users/advanced-recommendations (Alternative)
 CREATE OR REPLACE FUNCTION get_friend_of_friend_recommendations(target_user_id INTEGER)
@@ -254,13 +312,22 @@ $$ LANGUAGE plpgsql;
 -- ============================================
 
 -- Updated At Triggers
-CREATE TRIGGER update_users_modtime BEFORE UPDATE ON Users FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
-CREATE TRIGGER update_posts_modtime BEFORE UPDATE ON Posts FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+-- Users only counts profile edits; follow counter updates leave updated_at alone
+CREATE TRIGGER update_users_modtime BEFORE UPDATE OF username, email, password_hash, bio, profile_picture_url, is_private ON Users FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+-- Posts only counts content edits; engagement counter updates leave updated_at alone
+CREATE TRIGGER update_posts_modtime BEFORE UPDATE OF content, media_url, community_id ON Posts FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_comments_modtime BEFORE UPDATE ON Comments FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
 -- Community Member Count Trigger
 CREATE TRIGGER update_member_count AFTER INSERT OR DELETE ON CommunityMembers FOR EACH ROW EXECUTE FUNCTION update_community_member_count();
 
+-- Follow Count Trigger
+CREATE TRIGGER update_follow_counts AFTER INSERT OR UPDATE OF status_id OR DELETE ON Follows FOR EACH ROW EXECUTE FUNCTION update_user_follow_counts();
+
+-- Post Engagement Count Triggers
+CREATE TRIGGER update_post_like_count AFTER INSERT OR DELETE ON PostLikes FOR EACH ROW EXECUTE FUNCTION update_post_engagement_counts();
+CREATE TRIGGER update_post_comment_count AFTER INSERT OR DELETE ON Comments FOR EACH ROW EXECUTE FUNCTION update_post_engagement_counts();
+
 -- Message Soft Delete Triggers
 -- Used by: DELETE /api/messages/<id> (Note: Requires repository to perform UPDATE instead of DELETE)
 CREATE TRIGGER messages_sender_soft_delete_trigger
@@ -283,18 +350,16 @@ EXECUTE FUNCTION messages_receiver_soft_delete();
 -- Used by: GET /api/features/posts/popular
 CREATE OR REPLACE VIEW popular_posts_view AS
 SELECT 
-    p.post_id, p.user_id, u.username, u.profile_picture_url,
+    p.post_id, p.user_id, u.username, u.profile_picture_url, u.is_private AS author_is_private,
     p.content, p.media_url, p.community_id, c.name AS community_name,
     p.created_at, p.updated_at,
-    COALESCE(like_counts.like_count, 0) AS like_count,
-    COALESCE(comment_counts.comment_count, 0) AS comment_count,
-    (COALESCE(like_counts.like_count, 0) + (COALESCE(comment_counts.comment_count, 0) * 2)) AS engagement_score,
+    p.like_count,
+    p.comment_count,
+    (p.like_count + (p.comment_count * 2)) AS engagement_score,
     (p.created_at > NOW() - INTERVAL '7 days') AS is_recent
 FROM Posts p
 JOIN Users u ON p.user_id = u.user_id
 LEFT JOIN Communities c ON p.community_id = c.community_id
-LEFT JOIN (SELECT post_id, COUNT(*) AS like_count FROM PostLikes GROUP BY post_id) like_counts ON p.post_id = like_counts.post_id
-LEFT JOIN (SELECT post_id, COUNT(*) AS comment_count FROM Comments GROUP BY post_id) comment_counts ON p.post_id = comment_counts.post_id
 ORDER BY engagement_score DESC, p.created_at DESC;
 
 -- Active Users View
@@ -380,22 +445,29 @@ ORDER BY fs.user_id, recommendation_score DESC;
 -- ============================================
 
 -- Standard performance indexes
-CREATE INDEX idx_users_username ON Users(username);
-CREATE INDEX idx_users_email ON Users(email);
-CREATE INDEX idx_posts_user_id ON Posts(user_id);
-CREATE INDEX idx_posts_community_id ON Posts(community_id);
-CREATE INDEX idx_posts_created_at ON Posts(created_at DESC);
+-- Usernames are unique regardless of case; text_pattern_ops also serves LOWER(username) LIKE 'abc%'
+CREATE UNIQUE INDEX idx_users_username_lower ON Users(LOWER(username) text_pattern_ops);
+-- Emails are unique regardless of case, matching the LOWER(email) lookups
+CREATE UNIQUE INDEX idx_users_email_lower ON Users(LOWER(email));
+-- Community pages filter on community_id and page by newest first; the composite also
+-- serves plain community_id lookups. Per-user lookups use idx_posts_user_created below.
+CREATE INDEX idx_posts_community_created ON Posts(community_id, created_at DESC, post_id DESC);
+CREATE INDEX idx_posts_created_at ON Posts(created_at DESC, post_id DESC);
 CREATE INDEX idx_comments_post_id ON Comments(post_id);
 CREATE INDEX idx_comments_user_id ON Comments(user_id);
-CREATE INDEX idx_postlikes_post_id ON PostLikes(post_id);
+-- PostLikes needs no post_id index: the (post_id, user_id) primary key serves both
+-- per-post scans and the liked_by_user EXISTS probes
 CREATE INDEX idx_follows_follower_id ON Follows(follower_id);
 CREATE INDEX idx_follows_following_id ON Follows(following_id);
 CREATE INDEX IF NOT EXISTS idx_follows_follower_status ON Follows(follower_id, status_id);
 CREATE INDEX IF NOT EXISTS idx_follows_following_status ON Follows(following_id, status_id);
-CREATE INDEX idx_messages_sender_id ON Messages(sender_id);
-CREATE INDEX idx_messages_receiver_id ON Messages(receiver_id);
+CREATE INDEX IF NOT EXISTS idx_follows_follower_following_status ON Follows(follower_id, following_id, status_id);
+-- created_at is included so per-user message scans come back already ordered
+CREATE INDEX idx_messages_sender_id ON Messages(sender_id, created_at DESC);
+CREATE INDEX idx_messages_receiver_id ON Messages(receiver_id, created_at DESC);
 CREATE INDEX idx_messages_unread ON Messages(receiver_id) WHERE is_read = FALSE;
-CREATE INDEX IF NOT EXISTS idx_posts_user_created ON Posts(user_id, created_at);
+CREATE INDEX idx_messages_conversation ON Messages(sender_id, receiver_id, created_at DESC, message_id DESC);
+CREATE INDEX IF NOT EXISTS idx_posts_user_created ON Posts(user_id, created_at DESC, post_id DESC);
 CREATE INDEX IF NOT EXISTS idx_postlikes_user_id ON PostLikes(user_id);
 CREATE INDEX IF NOT EXISTS idx_comments_parent_post ON Comments(parent_comment_id, post_id);
 CREATE INDEX IF NOT EXISTS idx_follows_status ON Follows(status_id, following_id);
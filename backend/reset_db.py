@@ -1,6 +1,7 @@
 import os
 import sys
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
 
 # Add current directory to path so we can import api
 sys.path.append(os.getcwd())
@@ -13,36 +14,26 @@ def reset_db():
     # Get URI from Config
     uri = Config.SQLALCHEMY_DATABASE_URI
     
+    # One-shot script: a single connection, no pool to set up or keep alive
+    engine = create_engine(uri, poolclass=NullPool)
+    
+    # Read init.sql
+    print("Reading init.sql...")
+    with open('init.sql', 'r') as f:
+        sql_content = f.read()
+    
     try:
-        engine = create_engine(uri)
-        connection = engine.connect()
-        
-        # Read init.sql
-        print("Reading init.sql...")
-        with open('init.sql', 'r') as f:
-            sql_content = f.read()
-            
-        # Execute SQL content
-        # We might need to handle transaction commit manually
-        # Execute SQL content using raw connection to avoid % escaping issues
-        raw_conn = engine.raw_connection()
-        try:
-            cursor = raw_conn.cursor()
-            cursor.execute(sql_content)
-            raw_conn.commit()
-            print("Database reset successful!")
-            cursor.close()
-        except Exception as e:
-            raw_conn.rollback()
-            print(f"Error executing SQL: {e}")
-            sys.exit(1)
-        finally:
-            raw_conn.close()
-
-            
+        # engine.begin() commits on success and rolls back on error.
+        # no_parameters hands the script to the driver as-is, so its % signs are not
+        # treated as bind placeholders
+        with engine.begin() as conn:
+            conn.execution_options(no_parameters=True).exec_driver_sql(sql_content)
+        print("Database reset successful!")
     except Exception as e:
-        print(f"Connection error: {e}")
+        print(f"Error executing SQL: {e}")
         sys.exit(1)
+    finally:
+        engine.dispose()
 
 if __name__ == "__main__":
     reset_db()
@@ -7,12 +7,23 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 def run_tests():
     # Discover and run tests
-    loader = unittest.TestLoader()
     start_dir = 'backend/tests'
     if not os.path.exists(start_dir):
         # If running from inside backend
         start_dir = 'tests'
-        
+    
+    # Run test classes in parallel when pytest-xdist is installed; each worker uses
+    # its own schema (see tests/conftest.py)
+    try:
+        import pytest
+        import xdist  # noqa: F401
+    except ImportError:
+        pytest = None
+    
+    if pytest is not None:
+        sys.exit(pytest.main([start_dir, "-n", "auto", "--dist=loadscope"]))
+    
+    loader = unittest.TestLoader()
     suite = loader.discover(start_dir, pattern='test_*.py')
     
     runner = unittest.TextTestRunner(verbosity=2)
@@ -1,6 +1,7 @@
 import os
 import sys
 from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
 
 # Add current directory to path so we can import api
 sys.path.append(os.getcwd())
@@ -13,35 +14,30 @@ def seed_db():
     # Get URI from Config
     uri = Config.SQLALCHEMY_DATABASE_URI
     
+    # One-shot script: a single connection, no pool to set up or keep alive
+    engine = create_engine(uri, poolclass=NullPool)
+    
     try:
-        engine = create_engine(uri)
-        # Use raw connection for executing SQL script with multiple statements
-        raw_conn = engine.raw_connection()
-        cursor = raw_conn.cursor()
-        
-        try:
+        # engine.begin() commits on success and rolls back on error, so a failed seed
+        # leaves the previous data in place
+        with engine.begin() as conn:
+            # no_parameters hands each script to the driver as-is, so % signs are not
+            # treated as bind placeholders
+            conn = conn.execution_options(no_parameters=True)
+            
             # 1. Truncate tables
             print("Truncating tables...")
             # We use CASCADE to handle foreign key dependencies
-            # Order doesn't strictly matter with CASCADE, but good to be thorough
             tables = [
                 "Users", "Communities", "Roles", "PrivacyTypes", "FollowStatus",
                 "Posts", "Comments", "PostLikes", "CommunityMembers", 
                 "Follows", "Messages"
             ]
             
-            for table in tables:
-                # Check if table exists before truncating to avoid errors if init.sql wasn't run
-                # But typically we assume schema exists. 
-                # To be safe against "relation does not exist" if schema is empty, we could wrap in try/except 
-                # but valid schema is a prerequisite for seeding.
-                try:
-                    cursor.execute(f"TRUNCATE TABLE {table} RESTART IDENTITY CASCADE;")
-                except Exception as table_e:
-                    # If table doesn't exist, just skip it but warn? 
-                    # Actually, if tables don't exist, we can't seed anyway.
-                    # Let's assume schema exists as per requirement.
-                    pass
+            # One statement takes all the locks at once instead of one table at a time.
+            # Valid schema is a prerequisite for seeding (run reset_db.py first)
+            table_str = ", ".join(tables)
+            conn.exec_driver_sql(f"TRUNCATE TABLE {table_str} RESTART IDENTITY CASCADE;")
 
             # 2. Read seed_data.sql
             print("Reading seed_data.sql...")
@@ -50,22 +46,14 @@ def seed_db():
                 
             # 3. Execute SQL content
             print("Executing seed statements...")
-            cursor.execute(sql_content)
-            
-            raw_conn.commit()
-            print("Database seeding successful!")
-            
-        except Exception as e:
-            raw_conn.rollback()
-            print(f"Error executing SQL: {e}")
-            sys.exit(1)
-        finally:
-            cursor.close()
-            raw_conn.close()
+            conn.exec_driver_sql(sql_content)
             
+        print("Database seeding successful!")
     except Exception as e:
-        print(f"Connection error: {e}")
+        print(f"Error executing SQL: {e}")
         sys.exit(1)
+    finally:
+        engine.dispose()
 
 if __name__ == "__main__":
     seed_db()
@@ -1,51 +1,87 @@
 import unittest
 from api.extensions import db
 from sqlalchemy import text
+from sqlalchemy.orm import scoped_session, sessionmaker
 from app import app
 
 class BaseTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        """Set up test application context once for the class"""
+        """Set up test application context and the class-wide transaction"""
         cls.app = app
         cls.app.config['TESTING'] = True
+        # Ids restart for every test class, so never serve rows from Redis
+        cls.app.config['REDIS_URL'] = None
         cls.app.config['SQLALCHEMY_DATABASE_URI'] = app.config['SQLALCHEMY_DATABASE_URI']
         cls.app_context = cls.app.app_context()
         cls.app_context.push()
 
+        # The whole class runs inside one transaction that is rolled back at the end,
+        # and each test inside a SAVEPOINT rolled back in tearDown, so nothing a test
+        # writes is ever committed
+        cls.connection = db.engine.connect()
+        cls.transaction = cls.connection.begin()
+        cls._clear_data(cls.connection)
+
+        # App code commits freely; joined this way, its commits only release savepoints.
+        # Repositories only run text() SQL, so there are no ORM objects to flush or expire
+        cls._app_session = db.session
+        db.session = scoped_session(sessionmaker(
+            bind=cls.connection,
+            join_transaction_mode="create_savepoint",
+            autoflush=False,
+            expire_on_commit=False
+        ))
+
+        # Fixtures shared by every test in the class are created once, outside the per-test
+        # savepoints, so rolling a test back leaves them in place
+        cls.setUpClassData()
+        db.session.remove()
+
+    @classmethod
+    def setUpClassData(cls):
+        """Create class-wide fixtures; override in subclasses (tests must not modify them)"""
+        pass
+
     @classmethod
     def tearDownClass(cls):
-        """Remove application context"""
+        """Roll back everything the class did and remove application context"""
+        db.session.remove()
+        db.session = cls._app_session
+        cls.transaction.rollback()
+        cls.connection.close()
         cls.app_context.pop()
 
-    def setUp(self):
-        """Run before each test"""
-        # Clean up database
-        self._clear_data()
-        
-    def _clear_data(self):
-        # Truncate all data tables but keep lookup tables (Roles, PrivacyTypes, FollowStatus)
-        # We use CASCADE to handle foreign keys
+    @classmethod
+    def _clear_data(cls, conn):
+        # Start every class from empty data tables but keep lookup tables (Roles, PrivacyTypes,
+        # FollowStatus). This runs inside the class transaction, so existing rows come back
+        # when it is rolled back.
         tables = [
-            "Comments", "Messages", "Posts", "CommunityMembers", 
+            "Comments", "Messages", "Posts", "CommunityMembers",
             "Follows", "Communities", "AuditLog", "Users"
         ]
-        
-        with db.engine.connect() as conn:
-            # Disable triggers temporarily if needed? No, CASCADE should filter down.
-            # Actually, order might matter if not using CASCADE? RESTART IDENTITY CASCADE handles everything.
-            # But we need to be careful not to delete Roles if Users reference them?
-            # Users reference Roles? No, UserRoles? 
-            # Users table doesn't reference Roles directly? 
-            # Let's check init.sql if I could.
-            # Users has role_id? 
-            # If Users has FK to Roles, Truncating Users is fine. Roles stays.
-            
-            # Construct single truncate command
-            table_str = ", ".join(tables)
-            conn.execute(text(f"TRUNCATE TABLE {table_str} RESTART IDENTITY CASCADE"))
-            conn.commit()
+        # Tests never commit, so after the first class the tables are normally already empty.
+        # Checking is a few index probes, while TRUNCATE rewrites every table and index file
+        has_rows = " OR ".join(f"EXISTS(SELECT 1 FROM {table})" for table in tables)
+        if not conn.execute(text(f"SELECT {has_rows}")).scalar():
+            # Identities still restart, since sequences advance even when inserts roll back
+            conn.execute(text("""
+                SELECT setval(pg_get_serial_sequence(c.table_name, c.column_name), 1, false)
+                FROM information_schema.columns c
+                WHERE c.table_schema = current_schema()
+                  AND c.table_name = ANY(:tables)
+                  AND c.column_default LIKE 'nextval%'
+            """), {"tables": [table.lower() for table in tables]})
+            return
+        table_str = ", ".join(tables)
+        conn.execute(text(f"TRUNCATE TABLE {table_str} RESTART IDENTITY CASCADE"))
+
+    def setUp(self):
+        """Run before each test"""
+        self.savepoint = self.connection.begin_nested()
 
     def tearDown(self):
         """Run after each test"""
         db.session.remove()
+        self.savepoint.rollback()
@@ -0,0 +1,50 @@
+import hashlib
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Make 'api', 'app' and 'tests.base_test' importable however pytest is started
+# (plain 'pytest', or from the repository root), once per session
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+def _reset_stale_worker_schema(schema):
+    """Recreate a worker schema built from an older init.sql, empty, so init_database rebuilds it
+
+    Worker schemas persist between runs, so the DDL normally runs once per worker. The schema
+    comment records which init.sql the tables came from; any edit to the file invalidates it.
+    """
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.pool import NullPool
+    from api.config import Config
+
+    with open(os.path.join(BACKEND_DIR, 'init.sql'), 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+    engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, poolclass=NullPool)
+    try:
+        with engine.begin() as conn:
+            current = conn.execute(
+                text("SELECT obj_description(to_regnamespace(:schema), 'pg_namespace')"),
+                {"schema": schema}
+            ).scalar()
+            if current != digest:
+                conn.execute(text(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE'))
+                conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+                conn.execute(text(f"COMMENT ON SCHEMA \"{schema}\" IS '{digest}'"))
+    except OperationalError:
+        # No database reachable; the DB-backed tests report that themselves
+        pass
+    finally:
+        engine.dispose()
+
+
+# Under pytest-xdist every worker gets its own schema, so one worker's TRUNCATEs never
+# block or wipe another's data. This has to run before api.config is imported.
+worker = os.environ.get("PYTEST_XDIST_WORKER")
+if worker and "DATABASE_SCHEMA" not in os.environ:
+    os.environ["DATABASE_SCHEMA"] = f"test_{worker}"
+    _reset_stale_worker_schema(os.environ["DATABASE_SCHEMA"])
@@ -5,14 +5,14 @@ from api.repositories.post_repository import PostRepository
 from api.entities.entities import User, Post, Comment
 
 class TestCommentRepository(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.comment_repo = CommentRepository()
-        self.user_repo = UserRepository()
-        self.post_repo = PostRepository()
+    @classmethod
+    def setUpClassData(cls):
+        cls.comment_repo = CommentRepository()
+        cls.user_repo = UserRepository()
+        cls.post_repo = PostRepository()
         
-        self.user = self.user_repo.create(User(username="comm_tester", email="ct@e.com", password_hash="x"))
-        self.post = self.post_repo.create(Post(user_id=self.user.user_id, content="Root Post"))
+        cls.user = cls.user_repo.create(User(username="comm_tester", email="ct@e.com", password_hash="x"))
+        cls.post = cls.post_repo.create(Post(user_id=cls.user.user_id, content="Root Post"))
 
     def test_create_and_get_comment(self):
         comment = Comment(post_id=self.post.post_id, user_id=self.user.user_id, content="Reply")
@@ -33,6 +33,20 @@ class TestCommentRepository(BaseTest):
         assert replies[0].content == "Nested"
         assert self.comment_repo.count_replies(root_comment.comment_id) == 1
 
+    def test_reply_counts_in_listing(self):
+        root_comment = self.comment_repo.create(Comment(post_id=self.post.post_id, user_id=self.user.user_id, content="RootC"))
+        self.comment_repo.create(Comment(post_id=self.post.post_id, user_id=self.user.user_id, content="Nested", parent_comment_id=root_comment.comment_id))
+        
+        comments = self.comment_repo.get_by_post_id_with_reply_counts(self.post.post_id)
+        assert len(comments) == 1
+        assert comments[0]['id'] == root_comment.comment_id
+        assert comments[0]['reply_count'] == 1
+        assert comments[0]['username'] == "comm_tester"
+        
+        replies = self.comment_repo.get_replies_with_reply_counts(root_comment.comment_id)
+        assert replies[0]['content'] == "Nested"
+        assert replies[0]['reply_count'] == 0
+
     def test_delete(self):
         c = self.comment_repo.create(Comment(post_id=self.post.post_id, user_id=self.user.user_id, content="Del"))
         assert self.comment_repo.delete(c.comment_id) is True
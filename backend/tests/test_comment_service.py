@@ -4,16 +4,16 @@ from api.services.post_service import PostService
 from api.services.auth_service import AuthService
 
 class TestCommentService(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.comment_service = CommentService()
-        self.post_service = PostService()
-        self.auth_service = AuthService()
+    @classmethod
+    def setUpClassData(cls):
+        cls.comment_service = CommentService()
+        cls.post_service = PostService()
+        cls.auth_service = AuthService()
         
-        user_res = self.auth_service.register("ctor", "c@t.com", "p")
-        self.user_id = user_res['user']['user_id']
-        post_res = self.post_service.create_post(self.user_id, "Post content")
-        self.post_id = post_res['post']['post_id']
+        user_res = cls.auth_service.register("ctor", "c@t.com", "p")
+        cls.user_id = user_res['user']['user_id']
+        post_res = cls.post_service.create_post(cls.user_id, "Post content")
+        cls.post_id = post_res['post']['post_id']
 
     def test_add_comment(self):
         res = self.comment_service.create_comment(self.post_id, self.user_id, "Nice post")
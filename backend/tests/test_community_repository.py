@@ -4,12 +4,12 @@ from api.repositories.user_repository import UserRepository
 from api.entities.entities import User, Community
 
 class TestCommunityRepository(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.community_repo = CommunityRepository()
-        self.user_repo = UserRepository()
+    @classmethod
+    def setUpClassData(cls):
+        cls.community_repo = CommunityRepository()
+        cls.user_repo = UserRepository()
         
-        self.user = self.user_repo.create(User(username="comm_r_tester", email="crt@e.com", password_hash="x"))
+        cls.user = cls.user_repo.create(User(username="comm_r_tester", email="crt@e.com", password_hash="x"))
 
     def test_create_and_get(self):
         c = Community(name="Pythonistas", description="Py Lovers", creator_id=self.user.user_id, privacy_id=1)
@@ -34,7 +34,52 @@ class TestCommunityRepository(BaseTest):
         
         # Count
         assert self.community_repo.count_members(c.community_id) == 2
+        assert self.community_repo.count_members(c.community_id, role_id=1) == 1
         
         # Check specific member
         member = self.community_repo.get_member(c.community_id, u2.user_id)
         assert member.role_id == 3
+
+    def test_get_members_orders_by_role(self):
+        c = self.community_repo.create(Community(name="OrderTest", description="d", creator_id=self.user.user_id, privacy_id=1))
+        u2 = self.user_repo.create(User(username="aaa_member", email="aaa@t.com", password_hash="x"))
+        self.community_repo.add_member(c.community_id, u2.user_id, role_id=3)
+        
+        members = self.community_repo.get_members(c.community_id)
+        assert [m['user_id'] for m in members] == [self.user.user_id, u2.user_id]
+        assert members[0]['username'] == "comm_r_tester"
+        assert 'profile_picture_url' in members[0]
+
+    def test_add_existing_member_returns_none(self):
+        c = self.community_repo.create(Community(name="DupTest", description="d", creator_id=self.user.user_id, privacy_id=1))
+        u2 = self.user_repo.create(User(username="dup_member", email="dup@t.com", password_hash="x"))
+        assert self.community_repo.add_member(c.community_id, u2.user_id, role_id=3) is not None
+        assert self.community_repo.add_member(c.community_id, u2.user_id, role_id=3) is None
+        assert self.community_repo.count_members(c.community_id) == 2
+
+    def test_remove_member_unless_last_admin(self):
+        c = self.community_repo.create(Community(name="LeaveTest", description="d", creator_id=self.user.user_id, privacy_id=1))
+        u2 = self.user_repo.create(User(username="leaver", email="leaver@t.com", password_hash="x"))
+        self.community_repo.add_member(c.community_id, u2.user_id, role_id=3)
+        
+        # The only admin stays
+        assert self.community_repo.remove_member_unless_last_admin(c.community_id, self.user.user_id) is None
+        assert self.community_repo.get_member(c.community_id, self.user.user_id) is not None
+        
+        assert self.community_repo.remove_member_unless_last_admin(c.community_id, u2.user_id) == 3
+        assert self.community_repo.get_member(c.community_id, u2.user_id) is None
+
+    def test_remove_member_as(self):
+        c = self.community_repo.create(Community(name="KickTest", description="d", creator_id=self.user.user_id, privacy_id=1))
+        mod = self.user_repo.create(User(username="kick_mod", email="kmod@t.com", password_hash="x"))
+        member = self.user_repo.create(User(username="kick_member", email="kmem@t.com", password_hash="x"))
+        self.community_repo.add_member(c.community_id, mod.user_id, role_id=2)
+        self.community_repo.add_member(c.community_id, member.user_id, role_id=3)
+        
+        # Members can't remove anyone, and moderators can't remove the admin
+        assert self.community_repo.remove_member_as(c.community_id, member.user_id, mod.user_id) is None
+        assert self.community_repo.remove_member_as(c.community_id, mod.user_id, self.user.user_id) is None
+        assert self.community_repo.count_members(c.community_id) == 3
+        
+        assert self.community_repo.remove_member_as(c.community_id, mod.user_id, member.user_id) == 3
+        assert self.community_repo.get_member(c.community_id, member.user_id) is None
@@ -3,13 +3,13 @@ from api.services.community_service import CommunityService
 from api.services.auth_service import AuthService
 
 class TestCommunityService(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.community_service = CommunityService()
-        self.auth_service = AuthService()
+    @classmethod
+    def setUpClassData(cls):
+        cls.community_service = CommunityService()
+        cls.auth_service = AuthService()
         
-        res = self.auth_service.register("comm_creator", "cc@t.com", "p")
-        self.creator_id = res['user']['user_id']
+        res = cls.auth_service.register("comm_creator", "cc@t.com", "p")
+        cls.creator_id = res['user']['user_id']
 
     def test_create_automatically_adds_admin(self):
         c = self.community_service.create_community("AutoAdmin", "Desc", self.creator_id)
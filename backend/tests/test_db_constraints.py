@@ -1,40 +1,37 @@
 import unittest
 from sqlalchemy import text
 from api.extensions import db
-from app import app
 from sqlalchemy.exc import IntegrityError, DBAPIError
+from tests.base_test import BaseTest
 
-class TestDatabaseConstraints(unittest.TestCase):
-    """Test database CHECK constraints"""
+class TestDatabaseConstraints(BaseTest):
+    """Test database CHECK constraints
 
-    @classmethod
-    def setUpClass(cls):
-        """Set up test application context"""
-        cls.app = app
-        cls.app_context = cls.app.app_context()
-        cls.app_context.push()
+    Each test runs inside BaseTest's SAVEPOINT, so the commits below only release
+    nested savepoints and nothing is left behind to clean up.
+    """
 
     @classmethod
-    def tearDownClass(cls):
-        """Remove application context"""
-        cls.app_context.pop()
-
-    def setUp(self):
-        """Clean up before each test"""
-        # Clean up any potential leftover data
-        try:
-            db.session.rollback()
-            db.session.execute(text("DELETE FROM Comments"))
-            db.session.execute(text("DELETE FROM Messages"))
-            db.session.execute(text("DELETE FROM Posts"))
-            db.session.execute(text("DELETE FROM Users WHERE username LIKE 'constraint_test%'"))
-            db.session.commit()
-        except:
-            db.session.rollback()
-
-    def tearDown(self):
-        """Clean up after each test"""
-        self.setUp()
+    def setUpClassData(cls):
+        # Valid rows the constraint checks hang off, created once for the whole class
+        ids = dict(db.session.execute(text("""
+            INSERT INTO Users (username, email, password_hash)
+            VALUES ('constraint_test_p', 'post@test.com', 'hash'),
+                   ('constraint_test_c', 'comment@test.com', 'hash'),
+                   ('constraint_test_m1', 'msg1@test.com', 'hash'),
+                   ('constraint_test_m2', 'msg2@test.com', 'hash')
+            RETURNING username, user_id
+        """)).all())
+        cls.post_user_id = ids['constraint_test_p']
+        cls.comment_user_id = ids['constraint_test_c']
+        cls.sender_id = ids['constraint_test_m1']
+        cls.receiver_id = ids['constraint_test_m2']
+        
+        cls.comment_post_id = db.session.execute(text("""
+            INSERT INTO Posts (user_id, content) VALUES (:uid, 'Post content')
+            RETURNING post_id
+        """), {"uid": cls.comment_user_id}).scalar()
+        db.session.commit()
 
     def test_user_email_constraint(self):
         """Test valid and invalid email formats"""
@@ -79,13 +76,7 @@ class TestDatabaseConstraints(unittest.TestCase):
         """Test post content/media_url requirement"""
 
         
-        # Create user first
-        db.session.execute(text("""
-            INSERT INTO Users (username, email, password_hash)
-            VALUES ('constraint_test_p', 'post@test.com', 'hash')
-        """))
-        db.session.commit()
-        user_id = db.session.execute(text("SELECT user_id FROM Users WHERE username='constraint_test_p'")).scalar()
+        user_id = self.post_user_id
 
         # Valid: Content only
         try:
@@ -122,18 +113,8 @@ class TestDatabaseConstraints(unittest.TestCase):
         """Test comment minimum length constraint"""
 
         
-        # Setup user and post
-        db.session.execute(text("""
-            INSERT INTO Users (username, email, password_hash)
-            VALUES ('constraint_test_c', 'comment@test.com', 'hash')
-        """))
-        user_id = db.session.execute(text("SELECT user_id FROM Users WHERE username='constraint_test_c'")).scalar()
-        
-        db.session.execute(text("""
-            INSERT INTO Posts (user_id, content) VALUES (:uid, 'Post content')
-        """), {"uid": user_id})
-        post_id = db.session.execute(text("SELECT post_id FROM Posts WHERE user_id=:uid"), {"uid": user_id}).scalar()
-        db.session.commit()
+        user_id = self.comment_user_id
+        post_id = self.comment_post_id
 
         # Valid comment
         try:
@@ -174,15 +155,8 @@ class TestDatabaseConstraints(unittest.TestCase):
         """Test message self-send constraint"""
 
         
-        # Setup users
-        db.session.execute(text("""
-            INSERT INTO Users (username, email, password_hash)
-            VALUES ('constraint_test_m1', 'msg1@test.com', 'hash'),
-                   ('constraint_test_m2', 'msg2@test.com', 'hash')
-        """))
-        db.session.commit()
-        u1 = db.session.execute(text("SELECT user_id FROM Users WHERE username='constraint_test_m1'")).scalar()
-        u2 = db.session.execute(text("SELECT user_id FROM Users WHERE username='constraint_test_m2'")).scalar()
+        u1 = self.sender_id
+        u2 = self.receiver_id
 
         # Valid: Different users
         try:
@@ -33,3 +33,26 @@ class TestDatabaseIndexes(BaseTest):
         index_names = [row.indexname for row in result]
         
         assert 'idx_audit_log_user_id' in index_names
+
+    def test_username_lower_unique_index_exists(self):
+        """Usernames and emails are unique case-insensitively via functional indexes"""
+        query = text("SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'users'")
+        result = db.session.execute(query).fetchall()
+        indexes = {row.indexname: row.indexdef for row in result}
+        
+        assert 'idx_users_username_lower' in indexes
+        assert 'UNIQUE' in indexes['idx_users_username_lower']
+        assert 'lower' in indexes['idx_users_username_lower']
+        assert 'idx_users_email_lower' in indexes
+        assert 'UNIQUE' in indexes['idx_users_email_lower']
+
+    def test_post_listing_indexes_exist(self):
+        """User and community post listings are served by (filter, created_at) composites"""
+        query = text("SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'posts'")
+        result = db.session.execute(query).fetchall()
+        indexes = {row.indexname: row.indexdef for row in result}
+        
+        assert 'idx_posts_user_created' in indexes
+        assert 'idx_posts_community_created' in indexes
+        assert 'created_at DESC' in indexes['idx_posts_user_created']
+        assert 'created_at DESC' in indexes['idx_posts_community_created']
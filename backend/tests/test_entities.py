@@ -3,7 +3,9 @@
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
 
 from datetime import datetime
 from api.entities.entities import (
@@ -11,6 +13,9 @@ from api.entities.entities import (
     Comment, Community, CommunityMember, Follow, Message
 )
 
+# Timestamps are only placeholders here; a fixed value keeps the tests deterministic
+FIXED_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
 
 def test_role():
     role = Role(role_id=1, role_name="admin")
@@ -42,7 +47,7 @@ def test_user():
         bio="Hello world",
         profile_picture_url="http://example.com/pic.jpg",
         is_private=False,
-        created_at=datetime.now()
+        created_at=FIXED_TIME
     )
     assert user.user_id == 1
     assert user.username == "testuser"
@@ -58,7 +63,7 @@ def test_post():
         community_id=None,
         content="Test post content",
         media_url=None,
-        created_at=datetime.now()
+        created_at=FIXED_TIME
     )
     assert post.post_id == 1
     assert post.user_id == 1
@@ -72,13 +77,20 @@ def test_comment():
         post_id=1,
         user_id=1,
         content="Test comment",
-        created_at=datetime.now()
+        created_at=FIXED_TIME
     )
     assert comment.comment_id == 1
     assert comment.post_id == 1
     assert comment.user_id == 1
 
 
+def test_comment_validate():
+    assert Comment(content="ok").validate() == []
+    assert Comment(content=" \n\t ").validate() == ["Comment content is required"]
+    assert Comment(content="").validate() == ["Comment content is required"]
+    assert Comment(content="x" * 2001).validate() == ["Comment must be at most 2000 characters"]
+
+
 
 def test_community():
     community = Community(
@@ -87,7 +99,7 @@ def test_community():
         description="A test community",
         creator_id=1,
         privacy_id=1,
-        created_at=datetime.now()
+        created_at=FIXED_TIME
     )
     assert community.community_id == 1
     assert community.name == "Test Community"
@@ -100,7 +112,7 @@ def test_community_member():
         community_id=1,
         user_id=1,
         role_id=1,
-        joined_at=datetime.now()
+        joined_at=FIXED_TIME
     )
     assert member.community_id == 1
     assert member.user_id == 1
@@ -113,7 +125,7 @@ def test_follow():
         follower_id=1,
         following_id=2,
         status_id=1,
-        created_at=datetime.now()
+        created_at=FIXED_TIME
     )
     assert follow.follower_id == 1
     assert follow.following_id == 2
@@ -129,7 +141,7 @@ def test_message():
         content="Hello!",
         media_url=None,
         is_read=False,
-        created_at=datetime.now()
+        created_at=FIXED_TIME
     )
     assert message.message_id == 1
     assert message.sender_id == 1
@@ -137,6 +149,14 @@ def test_message():
     assert message.is_read == False
 
 
+def test_message_validate_fields():
+    assert Message.validate_fields("Hi", None) == []
+    assert Message.validate_fields(None, "http://x/img.png") == []
+    assert Message.validate_fields(None, None) == ["Message must have content or media"]
+    assert Message.validate_fields("x" * 5001, None) == ["Message must be at most 5000 characters"]
+    assert Message(content="").validate() == ["Message must have content or media"]
+
+
 def test_default_values():
     """Test that default values work correctly"""
     user = User()
@@ -159,4 +179,5 @@ if __name__ == "__main__":
     test_community_member()
     test_follow()
     test_message()
+    test_message_validate_fields()
     test_default_values()
\ No newline at end of file
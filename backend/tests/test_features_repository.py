@@ -7,20 +7,20 @@ from api.entities.entities import User, Post, Community
 
 
 class TestFeaturesRepository(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.features_repo = FeaturesRepository()
-        self.user_repo = UserRepository()
-        self.post_repo = PostRepository()
-        self.community_repo = CommunityRepository()
+    @classmethod
+    def setUpClassData(cls):
+        cls.features_repo = FeaturesRepository()
+        cls.user_repo = UserRepository()
+        cls.post_repo = PostRepository()
+        cls.community_repo = CommunityRepository()
         
-        # Create test users
-        self.user1 = self.user_repo.create(User(
+        # Create test users once; each test's changes are rolled back around them
+        cls.user1 = cls.user_repo.create(User(
             username="features_user1", 
             email="fu1@test.com", 
             password_hash="hash123"
         ))
-        self.user2 = self.user_repo.create(User(
+        cls.user2 = cls.user_repo.create(User(
             username="features_user2", 
             email="fu2@test.com", 
             password_hash="hash123"
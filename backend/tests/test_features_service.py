@@ -6,19 +6,19 @@ from api.services.post_service import PostService
 
 
 class TestFeaturesService(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.features_service = FeaturesService()
-        self.auth_service = AuthService()
-        self.community_service = CommunityService()
-        self.post_service = PostService()
-        
-        # Register test users
-        res1 = self.auth_service.register("features_test_user1", "ftu1@test.com", "password123")
-        self.user1_id = res1['user']['user_id']
-        
-        res2 = self.auth_service.register("features_test_user2", "ftu2@test.com", "password123")
-        self.user2_id = res2['user']['user_id']
+    @classmethod
+    def setUpClassData(cls):
+        cls.features_service = FeaturesService()
+        cls.auth_service = AuthService()
+        cls.community_service = CommunityService()
+        cls.post_service = PostService()
+        
+        # Register test users once; each test's changes are rolled back around them
+        res1 = cls.auth_service.register("features_test_user1", "ftu1@test.com", "password123")
+        cls.user1_id = res1['user']['user_id']
+        
+        res2 = cls.auth_service.register("features_test_user2", "ftu2@test.com", "password123")
+        cls.user2_id = res2['user']['user_id']
 
     def test_get_popular_posts_success(self):
         """Test getting popular posts returns success"""
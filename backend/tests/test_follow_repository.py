@@ -4,13 +4,13 @@ from api.repositories.user_repository import UserRepository
 from api.entities.entities import User, Follow
 
 class TestFollowRepository(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.follow_repo = FollowRepository()
-        self.user_repo = UserRepository()
+    @classmethod
+    def setUpClassData(cls):
+        cls.follow_repo = FollowRepository()
+        cls.user_repo = UserRepository()
         
-        self.u1 = self.user_repo.create(User(username="f1", email="f1@e.com", password_hash="x"))
-        self.u2 = self.user_repo.create(User(username="f2", email="f2@e.com", password_hash="x"))
+        cls.u1 = cls.user_repo.create(User(username="f1", email="f1@e.com", password_hash="x"))
+        cls.u2 = cls.user_repo.create(User(username="f2", email="f2@e.com", password_hash="x"))
 
     def test_create_and_get(self):
         f = Follow(follower_id=self.u1.user_id, following_id=self.u2.user_id, status_id=2)
@@ -36,3 +36,33 @@ class TestFollowRepository(BaseTest):
         
         assert self.follow_repo.count_followers(self.u2.user_id) == 1
         assert self.follow_repo.count_following(self.u1.user_id) == 1
+
+    def test_denormalized_counts_follow_status(self):
+        self.follow_repo.create(Follow(follower_id=self.u1.user_id, following_id=self.u2.user_id, status_id=1))
+        assert self.user_repo.get_by_id(self.u2.user_id).followers_count == 0
+        
+        self.follow_repo.update_status(self.u1.user_id, self.u2.user_id, 2)
+        assert self.user_repo.get_by_id(self.u2.user_id).followers_count == 1
+        assert self.user_repo.get_by_id(self.u1.user_id).following_count == 1
+        
+        self.follow_repo.delete(self.u1.user_id, self.u2.user_id)
+        assert self.user_repo.get_by_id(self.u2.user_id).followers_count == 0
+        assert self.user_repo.get_by_id(self.u1.user_id).following_count == 0
+
+    def test_is_following_cached(self):
+        self.follow_repo.create(Follow(follower_id=self.u1.user_id, following_id=self.u2.user_id, status_id=1))
+        assert self.follow_repo.get_following_ids(self.u1.user_id) == []
+        assert not self.follow_repo.is_following_cached(self.u1.user_id, self.u2.user_id)
+        
+        self.follow_repo.update_status(self.u1.user_id, self.u2.user_id, 2)
+        assert self.follow_repo.get_following_ids(self.u1.user_id) == [self.u2.user_id]
+        assert self.follow_repo.is_following_cached(self.u1.user_id, self.u2.user_id)
+
+    def test_is_following_only_accepted(self):
+        assert self.follow_repo.is_following(self.u1.user_id, self.u2.user_id) is False
+        
+        self.follow_repo.create(Follow(follower_id=self.u1.user_id, following_id=self.u2.user_id, status_id=1))
+        assert self.follow_repo.is_following(self.u1.user_id, self.u2.user_id) is False
+        
+        self.follow_repo.update_status(self.u1.user_id, self.u2.user_id, 2)
+        assert self.follow_repo.is_following(self.u1.user_id, self.u2.user_id) is True
@@ -3,22 +3,22 @@ from api.services.follow_service import FollowService
 from api.services.auth_service import AuthService
 
 class TestFollowService(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.follow_service = FollowService()
-        self.auth_service = AuthService()
+    @classmethod
+    def setUpClassData(cls):
+        cls.follow_service = FollowService()
+        cls.auth_service = AuthService()
         
         # Public user
-        r1 = self.auth_service.register("pub", "pub@e.com", "p")
-        self.pub_id = r1['user']['user_id']
+        r1 = cls.auth_service.register("pub", "pub@e.com", "p")
+        cls.pub_id = r1['user']['user_id']
         
         # Private user
-        r2 = self.auth_service.register("priv", "priv@e.com", "p", is_private=True)
-        self.priv_id = r2['user']['user_id']
+        r2 = cls.auth_service.register("priv", "priv@e.com", "p", is_private=True)
+        cls.priv_id = r2['user']['user_id']
         
         # Follower
-        r3 = self.auth_service.register("follower", "f@e.com", "p")
-        self.follower_id = r3['user']['user_id']
+        r3 = cls.auth_service.register("follower", "f@e.com", "p")
+        cls.follower_id = r3['user']['user_id']
 
     def test_follow_public_auto_accept(self):
         res = self.follow_service.follow_user(self.follower_id, self.pub_id)
@@ -39,3 +39,18 @@ class TestFollowService(BaseTest):
         self.follow_service.follow_user(self.follower_id, self.pub_id)
         res = self.follow_service.unfollow_user(self.follower_id, self.pub_id)
         assert res['success'] is True
+
+    def test_follow_twice_and_rerequest_after_reject(self):
+        self.follow_service.follow_user(self.follower_id, self.pub_id)
+        res = self.follow_service.follow_user(self.follower_id, self.pub_id)
+        assert res['success'] is False
+        assert res['error'] == "Already following this user"
+        
+        self.follow_service.follow_user(self.follower_id, self.priv_id)
+        self.follow_service.reject_follow_request(self.follower_id, self.priv_id)
+        res = self.follow_service.follow_user(self.follower_id, self.priv_id)
+        assert res['success'] is True
+        assert res['status'] == "pending"
+        
+        res = self.follow_service.follow_user(self.follower_id, 999999)
+        assert res['error'] == "User not found"
@@ -0,0 +1,47 @@
+"""Tests for the orjson-backed Flask JSON provider"""
+
+import sys
+import os
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
+
+import unittest
+from datetime import datetime
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from api.json_provider import OrjsonProvider
+from api.entities.entities import Post
+
+
+class TestOrjsonProvider(unittest.TestCase):
+    """Output must stay identical to Flask's default provider"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.provider = OrjsonProvider(self.app)
+        self.default = DefaultJSONProvider(self.app)
+
+    def test_matches_default_provider(self):
+        payload = {
+            "posts": [Post(post_id=1, user_id=2, content="Hi", created_at=datetime(2024, 1, 2, 3, 4, 5))],
+            "total": 1,
+            "message": None
+        }
+        assert self.provider.loads(self.provider.dumps(payload)) == self.default.loads(self.default.dumps(payload))
+
+    def test_sorted_keys(self):
+        assert self.provider.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+
+    def test_response(self):
+        with self.app.app_context():
+            response = self.provider.response({"ok": True})
+        assert response.mimetype == "application/json"
+        assert response.get_json() == {"ok": True}
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,13 +4,13 @@ from api.repositories.user_repository import UserRepository
 from api.entities.entities import User, Message
 
 class TestMessageRepository(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.message_repo = MessageRepository()
-        self.user_repo = UserRepository()
+    @classmethod
+    def setUpClassData(cls):
+        cls.message_repo = MessageRepository()
+        cls.user_repo = UserRepository()
         
-        self.sender = self.user_repo.create(User(username="msgSender", email="ms@e.com", password_hash="x"))
-        self.receiver = self.user_repo.create(User(username="msgReceiver", email="mr@e.com", password_hash="x"))
+        cls.sender = cls.user_repo.create(User(username="msgSender", email="ms@e.com", password_hash="x"))
+        cls.receiver = cls.user_repo.create(User(username="msgReceiver", email="mr@e.com", password_hash="x"))
 
     def test_create_and_get(self):
         msg = Message(sender_id=self.sender.user_id, receiver_id=self.receiver.user_id, content="Hi")
@@ -30,3 +30,36 @@ class TestMessageRepository(BaseTest):
         
         msgs = self.message_repo.get_conversation(self.sender.user_id, self.receiver.user_id)
         assert len(msgs) == 2
+
+    def test_conversation_keyset_pagination(self):
+        for i in range(3):
+            self.message_repo.create(Message(sender_id=self.sender.user_id, receiver_id=self.receiver.user_id, content=str(i)))
+        
+        first_page = self.message_repo.get_conversation(self.sender.user_id, self.receiver.user_id, limit=2)
+        assert [m.content for m in first_page] == ["2", "1"]
+        
+        second_page = self.message_repo.get_conversation(self.sender.user_id, self.receiver.user_id, limit=2,
+                                                         before_id=first_page[-1].message_id)
+        assert [m.content for m in second_page] == ["0"]
+
+    def test_conversation_with_user(self):
+        empty = self.message_repo.get_conversation_with_user(self.sender.user_id, self.receiver.user_id)
+        assert empty["other_user"]["user_id"] == self.receiver.user_id
+        assert empty["messages"] == []
+        
+        self.message_repo.create(Message(sender_id=self.sender.user_id, receiver_id=self.receiver.user_id, content="1"))
+        conv = self.message_repo.get_conversation_with_user(self.sender.user_id, self.receiver.user_id)
+        assert conv["other_user"]["username"] == self.receiver.username
+        assert [m.content for m in conv["messages"]] == ["1"]
+        
+        assert self.message_repo.get_conversation_with_user(self.sender.user_id, 999999) is None
+
+    def test_user_conversations(self):
+        self.message_repo.create(Message(sender_id=self.sender.user_id, receiver_id=self.receiver.user_id, content="1"))
+        self.message_repo.create(Message(sender_id=self.sender.user_id, receiver_id=self.receiver.user_id, content="2"))
+        
+        convs = self.message_repo.get_user_conversations(self.receiver.user_id)
+        assert len(convs) == 1
+        assert convs[0]['other_user_id'] == self.sender.user_id
+        assert convs[0]['content'] == "2"
+        assert convs[0]['unread_count'] == 2
@@ -4,19 +4,19 @@ from api.services.auth_service import AuthService
 from api.services.follow_service import FollowService
 
 class TestMessageService(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.msg_service = MessageService()
-        self.auth_service = AuthService()
-        self.follow_service = FollowService()
+    @classmethod
+    def setUpClassData(cls):
+        cls.msg_service = MessageService()
+        cls.auth_service = AuthService()
+        cls.follow_service = FollowService()
         
-        r1 = self.auth_service.register("s_svc", "s@s.com", "p")
-        self.sid = r1['user']['user_id']
-        r2 = self.auth_service.register("r_svc", "r@s.com", "p")
-        self.rid = r2['user']['user_id']
+        r1 = cls.auth_service.register("s_svc", "s@s.com", "p")
+        cls.sid = r1['user']['user_id']
+        r2 = cls.auth_service.register("r_svc", "r@s.com", "p")
+        cls.rid = r2['user']['user_id']
         
         # Create follow relationship (sender follows receiver)
-        self.follow_service.follow_user(self.sid, self.rid)
+        cls.follow_service.follow_user(cls.sid, cls.rid)
 
     def test_send_and_read(self):
         # Send
@@ -45,3 +45,16 @@ class TestMessageService(BaseTest):
         del_res = self.msg_service.delete_message(mid, self.sid)
         assert del_res['success'] is True
 
+
+    def test_mark_conversation_read(self):
+        self.msg_service.send_message(self.sid, self.rid, "One")
+        self.msg_service.send_message(self.sid, self.rid, "Two")
+        assert self.msg_service.get_unread_count(self.rid)['unread_count'] == 2
+        
+        res = self.msg_service.mark_conversation_read(self.rid, self.sid)
+        assert res['success'] is True
+        assert res['marked_count'] == 2
+        assert self.msg_service.get_unread_count(self.rid)['unread_count'] == 0
+        
+        # Nothing left to mark
+        assert self.msg_service.mark_conversation_read(self.rid, self.sid)['marked_count'] == 0
@@ -0,0 +1,53 @@
+"""Tests for password hashing helpers"""
+
+import sys
+import os
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
+
+import unittest
+
+from flask import Flask
+from werkzeug.security import generate_password_hash
+
+from api.utils.passwords import PasswordHasher, hash_password, verify_password, needs_rehash
+
+
+class TestPasswords(unittest.TestCase):
+    """Test cases for hash_password / verify_password"""
+
+    def test_hash_and_verify(self):
+        password_hash = hash_password("secret")
+        assert password_hash != "secret"
+        assert verify_password(password_hash, "secret") is True
+        assert verify_password(password_hash, "wrong") is False
+        assert needs_rehash(password_hash) is False
+
+    def test_legacy_werkzeug_hash(self):
+        """Hashes created before the switch still verify"""
+        legacy = generate_password_hash("secret")
+        assert verify_password(legacy, "secret") is True
+        assert verify_password(legacy, "wrong") is False
+
+    def test_empty_hash(self):
+        assert verify_password("", "secret") is False
+
+    @unittest.skipUnless(PasswordHasher, "argon2-cffi not installed; hashes are never flagged for rehash")
+    def test_testing_profile_is_cheap(self):
+        """Under TESTING hashes use the minimum cost, and login does not upgrade them"""
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        with app.app_context():
+            password_hash = hash_password("secret")
+            assert verify_password(password_hash, "secret") is True
+            assert needs_rehash(password_hash) is False
+        
+        # Outside tests the hash still verifies, but is below the production cost
+        assert verify_password(password_hash, "secret") is True
+        assert needs_rehash(password_hash) is True
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,16 +1,17 @@
 from tests.base_test import BaseTest
 from api.repositories.post_repository import PostRepository
 from api.repositories.user_repository import UserRepository
-from api.entities.entities import User, Post
+from api.repositories.comment_repository import CommentRepository
+from api.entities.entities import User, Post, Comment
 
 class TestPostRepository(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.post_repo = PostRepository()
-        self.user_repo = UserRepository()
+    @classmethod
+    def setUpClassData(cls):
+        cls.post_repo = PostRepository()
+        cls.user_repo = UserRepository()
         
         # Create user for posts
-        self.user = self.user_repo.create(User(username="post_tester", email="pt@e.com", password_hash="x"))
+        cls.user = cls.user_repo.create(User(username="post_tester", email="pt@e.com", password_hash="x"))
 
     def test_create_and_get_post(self):
         post = Post(user_id=self.user.user_id, content="Hello World")
@@ -43,6 +44,39 @@ class TestPostRepository(BaseTest):
         assert success is True
         assert self.post_repo.count_likes(post.post_id) == 0
 
+    def test_like_with_stats(self):
+        post = self.post_repo.create(Post(user_id=self.user.user_id, content="Likable"))
+        liker = self.user_repo.create(User(username="liker3", email="l3@e.com", password_hash="x"))
+        
+        res = self.post_repo.like_post_with_stats(post.post_id, liker.user_id)
+        assert res['post_exists'] is True and res['changed'] is True
+        assert res['like_count'] == 1
+        
+        # Second like is a no-op
+        res = self.post_repo.like_post_with_stats(post.post_id, liker.user_id)
+        assert res['changed'] is False
+        assert res['like_count'] == 1
+        
+        res = self.post_repo.unlike_post_with_stats(post.post_id, liker.user_id)
+        assert res['changed'] is True
+        assert res['like_count'] == 0
+        
+        res = self.post_repo.like_post_with_stats(999999, liker.user_id)
+        assert res['post_exists'] is False
+
+    def test_engagement_counters(self):
+        post = self.post_repo.create(Post(user_id=self.user.user_id, content="Counted"))
+        liker = self.user_repo.create(User(username="liker4", email="l4@e.com", password_hash="x"))
+        self.post_repo.like_post(post.post_id, liker.user_id)
+        CommentRepository().create(Comment(post_id=post.post_id, user_id=liker.user_id, content="Nice"))
+        
+        fetched = self.post_repo.get_by_id(post.post_id)
+        assert fetched.like_count == 1
+        assert fetched.comment_count == 1
+        
+        self.post_repo.unlike_post(post.post_id, liker.user_id)
+        assert self.post_repo.get_by_id(post.post_id).like_count == 0
+
     def test_get_with_stats(self):
         post = self.post_repo.create(Post(user_id=self.user.user_id, content="Stats Post"))
         liker = self.user_repo.create(User(username="liker2", email="l2@e.com", password_hash="x"))
@@ -1,16 +1,18 @@
 from tests.base_test import BaseTest
 from api.services.post_service import PostService
 from api.services.auth_service import AuthService
+from api.repositories.follow_repository import FollowRepository
+from api.entities.entities import Follow
 
 class TestPostService(BaseTest):
-    def setUp(self):
-        super().setUp()
-        self.post_service = PostService()
-        self.auth_service = AuthService()
+    @classmethod
+    def setUpClassData(cls):
+        cls.post_service = PostService()
+        cls.auth_service = AuthService()
         
         # Register main user
-        res = self.auth_service.register("poster", "p@s.com", "pass")
-        self.user_id = res['user']['user_id']
+        res = cls.auth_service.register("poster", "p@s.com", "pass")
+        cls.user_id = res['user']['user_id']
 
     def test_create_validate_post(self):
         # Empty content should fail
@@ -21,6 +23,9 @@ class TestPostService(BaseTest):
         res = self.post_service.create_post(self.user_id, content="Valid Content")
         assert res['success'] is True
         assert res['post']['content'] == "Valid Content"
+        assert res['post']['like_count'] == 0
+        assert res['post']['comment_count'] == 0
+        assert res['post']['liked_by_user'] is False
 
     def test_delete_ownership(self):
         # User 1 creates post
@@ -39,3 +44,53 @@ class TestPostService(BaseTest):
         del_res = self.post_service.delete_post(post_id, self.user_id)
         assert del_res['success'] is True
 
+
+    def test_feed_visibility(self):
+        friend_id = self.auth_service.register("friend", "f@s.com", "pass")['user']['user_id']
+        pending_id = self.auth_service.register("pending", "pe@s.com", "pass")['user']['user_id']
+        FollowRepository().create(Follow(follower_id=self.user_id, following_id=friend_id, status_id=2))
+        FollowRepository().create(Follow(follower_id=self.user_id, following_id=pending_id, status_id=1))
+        
+        self.post_service.create_post(self.user_id, content="Mine")
+        self.post_service.create_post(friend_id, content="Friend's")
+        self.post_service.create_post(pending_id, content="Hidden")
+        
+        feed = self.post_service.get_feed(self.user_id)
+        assert sorted(p['content'] for p in feed['posts']) == ["Friend's", "Mine"]
+
+    def test_get_post_respects_privacy(self):
+        priv_id = self.auth_service.register("private", "pr@s.com", "pass", is_private=True)['user']['user_id']
+        post_id = self.post_service.create_post(priv_id, content="Secret")['post']['post_id']
+        
+        assert self.post_service.get_post(post_id, self.user_id) is None
+        assert self.post_service.get_post(post_id, priv_id)['content'] == "Secret"
+        
+        FollowRepository().create(Follow(follower_id=self.user_id, following_id=priv_id, status_id=2))
+        assert self.post_service.get_post(post_id, self.user_id)['content'] == "Secret"
+
+    def test_discover_feed_hides_private_authors(self):
+        priv_id = self.auth_service.register("hidden", "h@s.com", "pass", is_private=True)['user']['user_id']
+        self.post_service.create_post(priv_id, content="Private")
+        self.post_service.create_post(self.user_id, content="Public")
+        
+        contents = [p['content'] for p in self.post_service.get_discover_feed(self.user_id)['posts']]
+        assert "Public" in contents
+        assert "Private" not in contents
+        
+        FollowRepository().create(Follow(follower_id=self.user_id, following_id=priv_id, status_id=2))
+        contents = [p['content'] for p in self.post_service.get_discover_feed(self.user_id)['posts']]
+        assert "Private" in contents
+
+    def test_get_user_posts_total(self):
+        for content in ("One", "Two", "Three"):
+            self.post_service.create_post(self.user_id, content=content)
+        
+        page = self.post_service.get_user_posts(self.user_id, self.user_id, limit=2)
+        assert [p['content'] for p in page['posts']] == ["Three", "Two"]
+        assert page['total'] == 3
+        
+        # Past the last page the total still comes back
+        past_end = self.post_service.get_user_posts(self.user_id, self.user_id, limit=2, offset=10)
+        assert past_end['posts'] == []
+        assert past_end['total'] == 3
+
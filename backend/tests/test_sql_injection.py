@@ -17,17 +17,17 @@ from tests.base_test import BaseTest
 class TestSQLInjection(BaseTest):
     """Test suite for SQL injection attack resistance"""
 
-    def setUp(self):
-        super().setUp()
-        self.user_repo = UserRepository()
-        self.post_repo = PostRepository()
-        self.comment_repo = CommentRepository()
-        self.community_repo = CommunityRepository()
-        self.message_repo = MessageRepository()
-        self.follow_repo = FollowRepository()
+    @classmethod
+    def setUpClassData(cls):
+        cls.user_repo = UserRepository()
+        cls.post_repo = PostRepository()
+        cls.comment_repo = CommentRepository()
+        cls.community_repo = CommunityRepository()
+        cls.message_repo = MessageRepository()
+        cls.follow_repo = FollowRepository()
         
-        # Create a test user for various tests
-        self.test_user = User(
+        # Create a test user for various tests (once; each test is rolled back around it)
+        cls.test_user = User(
             username="testuser",
             email="test@example.com",
             password_hash="hashed_password",
@@ -35,7 +35,7 @@ class TestSQLInjection(BaseTest):
             profile_picture_url=None,
             is_private=False
         )
-        self.test_user = self.user_repo.create(self.test_user)
+        cls.test_user = cls.user_repo.create(cls.test_user)
 
     # ===== User Repository SQL Injection Tests =====
     
@@ -1,9 +1,11 @@
 from tests.base_test import BaseTest
+from unittest.mock import patch
 from api.repositories.user_repository import UserRepository
-from api.entities.entities import User
+from api.services import cache
+from api.entities.entities import User, Follow
+from api.repositories.follow_repository import FollowRepository
 from sqlalchemy import text
 from api.extensions import db
-import time
 
 class TestUserRepository(BaseTest):
     def setUp(self):
@@ -26,22 +28,37 @@ class TestUserRepository(BaseTest):
         fetched = self.repo.get_by_id(created_user.user_id)
         assert fetched is not None
         assert fetched.username == "testrepo"
+        # Rows from get_by_id may be cached, so they never carry the password hash
+        assert fetched.password_hash is None
+
+    def test_username_is_case_insensitive(self):
+        self.repo.create(User(username="CaseUser", email="case@example.com", password_hash="hash"))
+        
+        assert self.repo.exists_by_username("caseuser") is True
+        assert self.repo.get_by_username("CASEUSER").username == "CaseUser"
+        assert self.repo.get_by_email("CASE@example.com") is not None
+        
+        with self.assertRaises(ValueError):
+            self.repo.create(User(username="caseuser", email="other@example.com", password_hash="hash"))
+        with self.assertRaises(ValueError):
+            self.repo.create(User(username="otheruser", email="CASE@example.com", password_hash="hash"))
 
     def test_update_updates_timestamp(self):
         user = User(username="updater", email="update@example.com", password_hash="h")
         created = self.repo.create(user)
-        original_ts = created.updated_at
         
-        # Ensure time passes if originally generated same timestamp
-        time.sleep(0.1)
+        # Tests share one transaction, so CURRENT_TIMESTAMP never moves; backdate the row instead.
+        # updated_at is not a trigger column, so this write keeps the old value
+        original_ts = db.session.execute(
+            text("UPDATE Users SET updated_at = updated_at - INTERVAL '1 day' WHERE user_id = :id RETURNING updated_at"),
+            {"id": created.user_id}
+        ).scalar()
         
         created.bio = "New Bio"
         updated = self.repo.update(created)
         
         assert updated.bio == "New Bio"
-        assert updated.updated_at is not None
-        if original_ts:
-            assert updated.updated_at > original_ts
+        assert updated.updated_at > original_ts
 
     def test_search_users(self):
         # Create users for search
@@ -54,3 +71,62 @@ class TestUserRepository(BaseTest):
         usernames = [u.username for u in results]
         assert "search_python" in usernames
         assert "search_java" not in usernames
+
+    def test_search_short_and_blank_queries(self):
+        self.repo.create(User(username="Pyth_fan", email="p1@e.com", password_hash="x"))
+        self.repo.create(User(username="other", email="p2@e.com", password_hash="x", bio="py lover"))
+        
+        assert self.repo.search("   ") == []
+        assert self.repo.search("") == []
+        
+        # Short terms only match the start of the username
+        results = self.repo.search(" py ")
+        assert [u.username for u in results] == ["Pyth_fan"]
+
+    def test_dict_listings_match_to_dict(self):
+        user = self.repo.create(User(username="dict_user", email="d1@e.com", password_hash="x"))
+        
+        assert self.repo.search_dicts("dict_user") == [user.to_dict()]
+        page = self.repo.get_all_dicts(limit=10)
+        assert user.to_dict() in page
+        assert all("password_hash" not in row for row in page)
+
+    def test_recommendations_are_friends_of_friends(self):
+        follows = FollowRepository()
+        me = self.repo.create(User(username="rec_me", email="r1@e.com", password_hash="x"))
+        friend = self.repo.create(User(username="rec_friend", email="r2@e.com", password_hash="x"))
+        suggested = self.repo.create(User(username="rec_suggested", email="r3@e.com", password_hash="x"))
+        pending = self.repo.create(User(username="rec_pending", email="r4@e.com", password_hash="x"))
+        
+        follows.create(Follow(follower_id=me.user_id, following_id=friend.user_id, status_id=2))
+        follows.create(Follow(follower_id=friend.user_id, following_id=suggested.user_id, status_id=2))
+        follows.create(Follow(follower_id=friend.user_id, following_id=me.user_id, status_id=2))
+        follows.create(Follow(follower_id=friend.user_id, following_id=pending.user_id, status_id=1))
+        
+        recommendations = self.repo.get_recommendations(me.user_id)
+        assert [r["suggested_user_id"] for r in recommendations] == [suggested.user_id]
+        assert recommendations[0]["suggested_username"] == "rec_suggested"
+        assert recommendations[0]["mutual_count"] == 1
+
+    def test_delete_invalidates_follow_neighbours(self):
+        follows = FollowRepository()
+        leaver = self.repo.create(User(username="del_leaver", email="d_l@e.com", password_hash="x"))
+        fan = self.repo.create(User(username="del_fan", email="d_f@e.com", password_hash="x"))
+        idol = self.repo.create(User(username="del_idol", email="d_i@e.com", password_hash="x"))
+        requester = self.repo.create(User(username="del_req", email="d_r@e.com", password_hash="x"))
+        
+        follows.create(Follow(follower_id=fan.user_id, following_id=leaver.user_id, status_id=2))
+        follows.create(Follow(follower_id=leaver.user_id, following_id=idol.user_id, status_id=2))
+        follows.create(Follow(follower_id=requester.user_id, following_id=leaver.user_id, status_id=1))
+        
+        with patch.object(cache, 'invalidate_user') as invalidate_user, \
+                patch.object(cache, 'invalidate_following') as invalidate_following:
+            assert self.repo.delete(leaver.user_id) is True
+        
+        # Only accepted follows move the trigger-kept counters
+        invalidate_user.assert_called_once_with(leaver.user_id, fan.user_id, idol.user_id)
+        invalidate_following.assert_called_once_with(fan.user_id)
+        assert self.repo.get_by_id(fan.user_id).following_count == 0
+        assert self.repo.get_by_id(idol.user_id).followers_count == 0
+        
+        assert self.repo.delete(leaver.user_id) is False
@@ -57,3 +57,28 @@ class TestUserService(BaseTest):
         # Bio should be missing if masked? Check implementation logic if needed.
         # Implementation: if private and cannot view -> returns only id, username, is_private
         assert "bio" not in fetched_user
+
+    def test_update_profile_uniqueness(self):
+        first = self.auth_service.register("first", "first@e.com", "p")['user']['user_id']
+        self.auth_service.register("second", "second@e.com", "p")
+        
+        res = self.user_service.update_profile(first, {"username": "SECOND"})
+        assert res['success'] is False
+        assert res['error'] == "Username already exists"
+        
+        res = self.user_service.update_profile(first, {"email": "Second@e.com"})
+        assert res['success'] is False
+        assert res['error'] == "Email already exists"
+        
+        # Changing only the case of your own username is not a conflict
+        res = self.user_service.update_profile(first, {"username": "First", "email": "first2@e.com"})
+        assert res['success'] is True
+        assert res['user']['username'] == "First"
+
+    def test_update_profile_changes_password(self):
+        user_id = self.auth_service.register("pw_changer", "pw@e.com", "old")['user']['user_id']
+        
+        res = self.user_service.update_profile(user_id, {"password": "new", "bio": "b"})
+        assert res['success'] is True
+        assert self.auth_service.login("pw_changer", "old")['success'] is False
+        assert self.auth_service.login("pw_changer", "new")['success'] is True
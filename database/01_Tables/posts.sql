@@ -4,6 +4,8 @@ CREATE TABLE Posts (
     community_id INT REFERENCES Communities(community_id) ON DELETE CASCADE ON UPDATE CASCADE,
     content TEXT,
     media_url TEXT,
+    like_count INT DEFAULT 0,
+    comment_count INT DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     CONSTRAINT chk_posts_content_or_media CHECK ((content IS NOT NULL AND content != '') OR (media_url IS NOT NULL AND media_url != ''))
@@ -10,15 +10,15 @@
 -- END;
 -- $$ LANGUAGE plpgsql;
 
--- Trigger for Posts table
+-- Trigger for Posts table (content columns only, so engagement counter updates leave it alone)
 CREATE TRIGGER update_posts_updated_at
-    BEFORE UPDATE ON Posts
+    BEFORE UPDATE OF content, media_url, community_id ON Posts
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
--- Trigger for Users table
+-- Trigger for Users table (profile columns only, so follow counter updates leave it alone)
 CREATE TRIGGER update_users_updated_at
-    BEFORE UPDATE ON Users
+    BEFORE UPDATE OF username, email, password_hash, bio, profile_picture_url, is_private ON Users
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
@@ -0,0 +1,5 @@
+-- Keeps Users.followers_count / Users.following_count in sync with accepted follows
+CREATE TRIGGER update_follow_counts
+    AFTER INSERT OR UPDATE OF status_id OR DELETE ON Follows
+    FOR EACH ROW
+    EXECUTE FUNCTION update_user_follow_counts();
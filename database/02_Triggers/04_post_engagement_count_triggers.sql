@@ -0,0 +1,10 @@
+-- Keeps Posts.like_count / Posts.comment_count in sync with PostLikes and Comments
+CREATE TRIGGER update_post_like_count
+    AFTER INSERT OR DELETE ON PostLikes
+    FOR EACH ROW
+    EXECUTE FUNCTION update_post_engagement_counts();
+
+CREATE TRIGGER update_post_comment_count
+    AFTER INSERT OR DELETE ON Comments
+    FOR EACH ROW
+    EXECUTE FUNCTION update_post_engagement_counts();
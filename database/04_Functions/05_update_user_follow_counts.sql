@@ -0,0 +1,31 @@
+-- Follow Count Update Trigger Function
+-- Used by: POST /api/users/<id>/follow, DELETE /api/users/<id>/follow, follow request accept/reject
+-- Only accepted follows (status_id = 2) are counted
+CREATE OR REPLACE FUNCTION update_user_follow_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (TG_OP = 'INSERT') THEN
+        IF NEW.status_id = 2 THEN
+            UPDATE Users SET followers_count = followers_count + 1 WHERE user_id = NEW.following_id;
+            UPDATE Users SET following_count = following_count + 1 WHERE user_id = NEW.follower_id;
+        END IF;
+        RETURN NEW;
+    ELSIF (TG_OP = 'DELETE') THEN
+        IF OLD.status_id = 2 THEN
+            UPDATE Users SET followers_count = followers_count - 1 WHERE user_id = OLD.following_id;
+            UPDATE Users SET following_count = following_count - 1 WHERE user_id = OLD.follower_id;
+        END IF;
+        RETURN OLD;
+    ELSIF (TG_OP = 'UPDATE') THEN
+        IF OLD.status_id <> 2 AND NEW.status_id = 2 THEN
+            UPDATE Users SET followers_count = followers_count + 1 WHERE user_id = NEW.following_id;
+            UPDATE Users SET following_count = following_count + 1 WHERE user_id = NEW.follower_id;
+        ELSIF OLD.status_id = 2 AND NEW.status_id <> 2 THEN
+            UPDATE Users SET followers_count = followers_count - 1 WHERE user_id = OLD.following_id;
+            UPDATE Users SET following_count = following_count - 1 WHERE user_id = OLD.follower_id;
+        END IF;
+        RETURN NEW;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
\ No newline at end of file
@@ -0,0 +1,21 @@
+-- Post Engagement Count Trigger Function
+-- Used by: POST/DELETE /api/posts/<id>/like, comment create/delete
+CREATE OR REPLACE FUNCTION update_post_engagement_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (TG_TABLE_NAME = 'postlikes') THEN
+        IF (TG_OP = 'INSERT') THEN
+            UPDATE Posts SET like_count = like_count + 1 WHERE post_id = NEW.post_id;
+        ELSIF (TG_OP = 'DELETE') THEN
+            UPDATE Posts SET like_count = like_count - 1 WHERE post_id = OLD.post_id;
+        END IF;
+    ELSIF (TG_TABLE_NAME = 'comments') THEN
+        IF (TG_OP = 'INSERT') THEN
+            UPDATE Posts SET comment_count = comment_count + 1 WHERE post_id = NEW.post_id;
+        ELSIF (TG_OP = 'DELETE') THEN
+            UPDATE Posts SET comment_count = comment_count - 1 WHERE post_id = OLD.post_id;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
\ No newline at end of file
@@ -3,22 +3,29 @@
 -- ============================================
 
 -- Standard performance indexes
-CREATE INDEX idx_users_username ON Users(username);
-CREATE INDEX idx_users_email ON Users(email);
-CREATE INDEX idx_posts_user_id ON Posts(user_id);
-CREATE INDEX idx_posts_community_id ON Posts(community_id);
-CREATE INDEX idx_posts_created_at ON Posts(created_at DESC);
+-- Usernames are unique regardless of case; text_pattern_ops also serves LOWER(username) LIKE 'abc%'
+CREATE UNIQUE INDEX idx_users_username_lower ON Users(LOWER(username) text_pattern_ops);
+-- Emails are unique regardless of case, matching the LOWER(email) lookups
+CREATE UNIQUE INDEX idx_users_email_lower ON Users(LOWER(email));
+-- Community pages filter on community_id and page by newest first; the composite also
+-- serves plain community_id lookups. Per-user lookups use idx_posts_user_created below.
+CREATE INDEX idx_posts_community_created ON Posts(community_id, created_at DESC, post_id DESC);
+CREATE INDEX idx_posts_created_at ON Posts(created_at DESC, post_id DESC);
 CREATE INDEX idx_comments_post_id ON Comments(post_id);
 CREATE INDEX idx_comments_user_id ON Comments(user_id);
-CREATE INDEX idx_postlikes_post_id ON PostLikes(post_id);
+-- PostLikes needs no post_id index: the (post_id, user_id) primary key serves both
+-- per-post scans and the liked_by_user EXISTS probes
 CREATE INDEX idx_follows_follower_id ON Follows(follower_id);
 CREATE INDEX idx_follows_following_id ON Follows(following_id);
 CREATE INDEX IF NOT EXISTS idx_follows_follower_status ON Follows(follower_id, status_id);
 CREATE INDEX IF NOT EXISTS idx_follows_following_status ON Follows(following_id, status_id);
-CREATE INDEX idx_messages_sender_id ON Messages(sender_id);
-CREATE INDEX idx_messages_receiver_id ON Messages(receiver_id);
+CREATE INDEX IF NOT EXISTS idx_follows_follower_following_status ON Follows(follower_id, following_id, status_id);
+-- created_at is included so per-user message scans come back already ordered
+CREATE INDEX idx_messages_sender_id ON Messages(sender_id, created_at DESC);
+CREATE INDEX idx_messages_receiver_id ON Messages(receiver_id, created_at DESC);
 CREATE INDEX idx_messages_unread ON Messages(receiver_id) WHERE is_read = FALSE;
-CREATE INDEX IF NOT EXISTS idx_posts_user_created ON Posts(user_id, created_at);
+CREATE INDEX idx_messages_conversation ON Messages(sender_id, receiver_id, created_at DESC, message_id DESC);
+CREATE INDEX IF NOT EXISTS idx_posts_user_created ON Posts(user_id, created_at DESC, post_id DESC);
 CREATE INDEX IF NOT EXISTS idx_postlikes_user_id ON PostLikes(user_id);
 CREATE INDEX IF NOT EXISTS idx_comments_parent_post ON Comments(parent_comment_id, post_id);
 CREATE INDEX IF NOT EXISTS idx_follows_status ON Follows(status_id, following_id);